@@ -6,12 +6,13 @@ Comprehensive WebSocket test that starts the server and tests all functionality.
 import asyncio
 import sys
 import os
-import time
-import subprocess
 from contextlib import asynccontextmanager
 
 # Add the parent directory to the Python path so we can import pytextprinter
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# (skip if already present so repeated runs don't pile up path entries)
+_parent = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _parent not in sys.path:
+    sys.path.insert(0, _parent)
 
 try:
     from pytextprinter.websocket_server import PyTextPrinterWebSocketServer
@@ -21,6 +22,13 @@ except ImportError as e:
     print("Make sure PyTextPrinter is installed and dependencies are available")
     sys.exit(1)
 
+# Use uvloop's faster event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def websocket_server():
@@ -32,10 +40,7 @@ async def websocket_server():
         print("Starting WebSocket server...")
         await server.start_server()
         print("✓ Server started successfully on localhost:8080")
-        
-        # Give server time to fully initialize
-        await asyncio.sleep(1)
-        
+
         yield server
         
     finally:
@@ -51,22 +56,28 @@ async def test_websocket_functionality():
     print("PYTEXTPRINTER WEBSOCKET COMPREHENSIVE TEST")
     print("=" * 60)
     
+    # Construct the client up front so its setup overlaps server startup
+    client = PyTextPrinterWebSocketClient('http://localhost:8080')
+
     async with websocket_server():
-        client = PyTextPrinterWebSocketClient('http://localhost:8080')
-        
         try:
-            # Test connection
+            # Test connection, retrying briefly while the server warms up
             print("\n1. Testing WebSocket connection...")
-            connected = await client.connect()
-            
+            connected = False
+            for _ in range(20):
+                if await client.connect():
+                    connected = True
+                    break
+                await asyncio.sleep(0.05)
+
             if not connected:
                 print("✗ Failed to connect to server")
                 return False
                 
             print("✓ Connected successfully!")
-            
-            # Wait for connection to stabilize
-            await asyncio.sleep(0.5)
+
+            # Wait for the handshake to complete
+            await client.wait_ready()
             
             # Test server info
             print("\n2. Getting server information...")
@@ -80,32 +91,38 @@ async def test_websocket_functionality():
             
             # Test console printing functions
             print("\n3. Testing console printing functions...")
-            
-            # Text printing
-            text_output = await client.print_text("Hello WebSocket!", bold=True)
+
+            # Pack all four console-print calls into a single batched frame
+            table_data = [["Feature", "Status"], ["WebSocket", "Working"], ["Socket.IO", "Compatible"]]
+            items = ["Real-time communication", "Cross-platform support", "Easy integration"]
+
+            results = await client.batch([
+                {'fn': 'print_text', 'args': ["Hello WebSocket!"], 'kwargs': {'bold': True}},
+                {'fn': 'print_banner', 'args': ["WEBSOCKET"], 'kwargs': {'char': '*', 'width': 30}},
+                {'fn': 'print_table', 'args': [table_data], 'kwargs': {'headers': ["Component", "Status"]}},
+                {'fn': 'print_list', 'args': [items], 'kwargs': {'bullet': '•'}}
+            ])
+            if results is None:
+                results = [{}] * 4
+            text_output, banner_output, table_output, list_output = [
+                r.get('output') if r.get('success') else None for r in results
+            ]
+
             if text_output and "Hello WebSocket!" in text_output:
                 print("   ✓ Text printing works")
             else:
                 print("   ✗ Text printing failed")
-            
-            # Banner
-            banner_output = await client.print_banner("WEBSOCKET", char="*", width=30)
+
             if banner_output and "WEBSOCKET" in banner_output:
                 print("   ✓ Banner printing works")
             else:
                 print("   ✗ Banner printing failed")
-            
-            # Table
-            table_data = [["Feature", "Status"], ["WebSocket", "Working"], ["Socket.IO", "Compatible"]]
-            table_output = await client.print_table(table_data, headers=["Component", "Status"])
+
             if table_output and "WebSocket" in table_output:
                 print("   ✓ Table printing works")
             else:
                 print("   ✗ Table printing failed")
-            
-            # List
-            items = ["Real-time communication", "Cross-platform support", "Easy integration"]
-            list_output = await client.print_list(items, bullet="•")
+
             if list_output and "Real-time communication" in list_output:
                 print("   ✓ List printing works")
             else:
@@ -141,30 +158,36 @@ async def test_websocket_functionality():
             # Check if printer is ready
             is_ready = await client.is_printer_ready()
             print(f"   Printer ready status: {is_ready}")
-            
-            # Test hardware print (will fail gracefully if no printer)
-            success = await client.print_to_hardware("Test message from WebSocket\n")
-            print(f"   Hardware text printing: {'✓ Success' if success else 'ℹ No printer (expected)'}")
-            
-            # Test barcode printing
-            success = await client.print_hardware_barcode("123456789", "CODE128")
-            print(f"   Hardware barcode printing: {'✓ Success' if success else 'ℹ No printer (expected)'}")
-            
-            # Test QR code
-            success = await client.print_hardware_qr_code("WebSocket Test", size=3)
-            print(f"   Hardware QR code printing: {'✓ Success' if success else 'ℹ No printer (expected)'}")
-            
+
+            # Pack the independent hardware calls into one ack-correlated
+            # batch frame; gathering per-event calls would race on the
+            # client's shared last_response mailbox
+            # (each fails gracefully if no printer is available)
+            results = await client.batch([
+                {'fn': 'print_to_hardware', 'args': ["Test message from WebSocket\n"]},
+                # CODE128 is the default barcode type
+                {'fn': 'print_hardware_barcode', 'args': ["123456789"]},
+                {'fn': 'print_hardware_qr_code', 'args': ["WebSocket Test"], 'kwargs': {'size': 3}},
+                {'fn': 'open_cash_drawer'}
+            ])
+            if results is None:
+                results = [{}] * 4
+            text_ok, barcode_ok, qr_ok, drawer_ok = [
+                bool(r.get('success')) for r in results
+            ]
+
+            print(f"   Hardware text printing: {'✓ Success' if text_ok else 'ℹ No printer (expected)'}")
+            print(f"   Hardware barcode printing: {'✓ Success' if barcode_ok else 'ℹ No printer (expected)'}")
+            print(f"   Hardware QR code printing: {'✓ Success' if qr_ok else 'ℹ No printer (expected)'}")
+            print(f"   Cash drawer command: {'✓ Success' if drawer_ok else 'ℹ No printer (expected)'}")
+
             # Test utility functions
             print("\n6. Testing utility functions...")
-            
+
             # Get printer status
             status = await client.get_printer_status()
             print(f"   Printer status: {status if status else 'No printer selected'}")
             
-            # Test cash drawer (will fail gracefully)
-            success = await client.open_cash_drawer()
-            print(f"   Cash drawer command: {'✓ Success' if success else 'ℹ No printer (expected)'}")
-            
             print("\n" + "=" * 60)
             print("✓ ALL WEBSOCKET TESTS COMPLETED SUCCESSFULLY!")
             print("✓ PyTextPrinter WebSocket functionality is working correctly")
@@ -176,8 +199,11 @@ async def test_websocket_functionality():
             
         except Exception as e:
             print(f"\n✗ Error during testing: {e}")
+            import os
             import traceback
-            traceback.print_exc()
+            print("".join(traceback.format_exception_only(type(e), e)))
+            if os.environ.get("PYTEXTPRINTER_TRACE"):
+                traceback.print_exc()
             return False
             
         finally:
@@ -206,6 +232,9 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}")
+        import os
         import traceback
-        traceback.print_exc()
+        print("".join(traceback.format_exception_only(type(e), e)))
+        if os.environ.get("PYTEXTPRINTER_TRACE"):
+            traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
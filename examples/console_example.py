@@ -5,29 +5,32 @@ Simple console example demonstrating PyTextPrinter basic functionality.
 This script shows console-based text printing features without requiring hardware printers.
 """
 
-from pytextprinter import TextPrinter, Colors
+import sys
+
+from pytextprinter import TextPrinter
 
 
 def main():
     """Main example function for console printing."""
-    print("PyTextPrinter Console Example")
-    print("=" * 30)
-    
+    # Narration lines are buffered per section and written in one call,
+    # so each block costs a single stdout write instead of one per line
+    out = sys.stdout.write
+    out("PyTextPrinter Console Example\n" + "=" * 30 + "\n")
+
     # Initialize the text printer for console output
     printer = TextPrinter()
-    
-    # Basic colored text printing
-    print("\n1. Colored Text Output:")
-    printer.print_colored("This is red text!", color="red")
-    printer.print_colored("This is green text!", color="green", bold=True)
-    printer.print_colored("This is blue text!", color="blue")
-    
+
+    # Basic text printing
+    out("\n1. Text Output:\n")
+    printer.print_text("This is plain text!")
+    printer.print_text("This is bold text!", bold=True)
+
     # Banner printing
-    print("\n2. Banner Example:")
+    out("\n2. Banner Example:\n")
     printer.print_banner("WELCOME", char="*", width=30)
-    
+
     # Table printing
-    print("\n3. Table Example:")
+    out("\n3. Table Example:\n")
     data = [
         ["Alice", "25", "Engineer"],
         ["Bob", "30", "Designer"],
@@ -35,45 +38,53 @@ def main():
     ]
     headers = ["Name", "Age", "Role"]
     printer.print_table(data, headers=headers, title="Employee List")
-    
+
     # List printing
-    print("\n4. List Example:")
-    items = ["Feature 1: Colored text", "Feature 2: Tables", "Feature 3: Banners"]
-    printer.print_list(items, bullet="→", color="cyan")
-    
+    out("\n4. List Example:\n")
+    items = ["Feature 1: Text styles", "Feature 2: Tables", "Feature 3: Banners"]
+    printer.print_list(items, bullet="→")
+
     # Dictionary printing
-    print("\n5. Dictionary Example:")
+    out("\n5. Dictionary Example:\n")
     config = {
         "Version": "0.1.0",
         "Platform": "Cross-platform",
         "Features": "Text, Hardware, ESC/POS"
     }
     printer.print_dict(config)
-    
-    # Progress bar example
-    print("\n6. Progress Bar Example:")
+
+    # Progress bar example (kept separate: each frame needs its own flush)
+    out("\n6. Progress Bar Example:\n")
+    sys.stdout.flush()
     import time
     for i in range(11):
         progress = i / 10
-        printer.print_progress_bar(progress, width=30)
+        # Defer flushing to the final frame; intermediate writes stay buffered
+        printer.print_progress_bar(progress, width=30, flush=(i == 10))
         time.sleep(0.1)
-    print()  # New line after progress bar
-    
+    out("\n")  # New line after progress bar
+
     # Hardware printer information (if available)
-    print("\n7. Available Printers:")
+    out("\n7. Available Printers:\n")
     try:
         printers = printer.list_printers(text_only=False, refresh=True)
         if printers:
+            # Snapshot availability once instead of re-querying the OS per printer
+            available = {p.name: printer.printer_manager.discovery.is_printer_available(p.name)
+                         for p in printers}
+            lines = []
             for i, p in enumerate(printers, 1):
-                status = "Ready" if printer.printer_manager.discovery.is_printer_available(p.name) else "Not Ready"
-                print(f"  {i}. {p.name} - {status}")
+                status = "Ready" if available[p.name] else "Not Ready"
+                lines.append(f"  {i}. {p.name} - {status}\n")
+            out("".join(lines))
         else:
-            print("  No printers detected")
+            out("  No printers detected\n")
     except Exception as e:
-        print(f"  Could not list printers: {e}")
-    
-    print("\n✓ Console example completed successfully!")
-    print("\nTo test hardware printing, run: hardware_printer_example.py")
+        out(f"  Could not list printers: {e}\n")
+
+    out("\n✓ Console example completed successfully!\n"
+        "\nTo test hardware printing, run: hardware_printer_example.py\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -83,5 +94,8 @@ if __name__ == "__main__":
         print("\nExample interrupted by user.")
     except Exception as e:
         print(f"\nError: {e}")
+        import os
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        print("".join(traceback.format_exception_only(type(e), e)))
+        if os.environ.get("PYTEXTPRINTER_TRACE"):
+            traceback.print_exc()
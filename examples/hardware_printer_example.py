@@ -9,6 +9,8 @@ This script shows how to:
 4. Print barcodes and QR codes
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pytextprinter import TextPrinter, BarcodeType
 
 
@@ -29,8 +31,15 @@ def main():
         print("Make sure you have a thermal or receipt printer connected.")
         return
     
-    for i, p in enumerate(text_printers, 1):
-        status = "✓" if printer.printer_manager.discovery.is_printer_available(p.name) else "✗"
+    # Probe availability for all printers in parallel - the queries are
+    # independent blocking OS calls, so wall-time collapses to the slowest one
+    with ThreadPoolExecutor(max_workers=min(8, len(text_printers))) as executor:
+        statuses = list(executor.map(
+            printer.printer_manager.discovery.is_printer_available,
+            [p.name for p in text_printers]
+        ))
+    for i, (p, is_available) in enumerate(zip(text_printers, statuses), 1):
+        status = "✓" if is_available else "✗"
         print(f"  {i}. {status} {p.name} ({p.driver}) - {p.port}")
     
     # Auto-select the first available text printer
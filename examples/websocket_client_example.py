@@ -10,32 +10,69 @@ import asyncio
 import logging
 from pytextprinter.websocket_client import PyTextPrinterWebSocketClient
 
+# Use uvloop's faster event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-async def main():
-    """Main function to demonstrate WebSocket client usage."""
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Stable receipt template, pre-encoded once at module load so repeated
+# prints skip the per-call JSON encoding entirely
+RECEIPT_LINES = [
+    "    WEBSOCKET TEST RECEIPT",
+    "    =====================",
+    "",
+    "Item: WebSocket Demo",
+    "Price: $0.00 (Free!)",
+    "",
+    "Total: $0.00",
+    "",
+    "Thank you for testing!",
+    ""
+]
+_RECEIPT_PAYLOAD = (msgpack.packb({'lines': RECEIPT_LINES, 'cut_paper': True})
+                    if msgpack else None)
+
+
+async def main(client=None):
+    """Main function to demonstrate WebSocket client usage.
+
+    Args:
+        client: Optional already-connected client to reuse. When None,
+            a new client is created and connected for this run.
+    """
     print("PyTextPrinter WebSocket Client Example")
     print("=" * 40)
-    
+
     # Configure logging
     logging.basicConfig(level=logging.INFO)
-    
-    # Create client
-    client = PyTextPrinterWebSocketClient('http://localhost:8080')
-    
+
+    # Create a client only if one wasn't injected
+    owns_client = client is None
+    if owns_client:
+        client = PyTextPrinterWebSocketClient('http://localhost:8080')
+
     try:
         # Connect to server
         print("\n1. Connecting to WebSocket server...")
-        connected = await client.connect()
-        
-        if not connected:
-            print("Failed to connect to server. Make sure the server is running.")
-            return
-        
+        if owns_client:
+            connected = await client.connect()
+
+            if not connected:
+                print("Failed to connect to server. Make sure the server is running.")
+                return
+
         print("✓ Connected successfully!")
-        
-        # Wait a moment for connection to stabilize
-        await asyncio.sleep(1)
-        
+
+        # Wait for the handshake to complete
+        await client.wait_ready()
+
         # Get server info
         print("\n2. Getting server information...")
         server_info = await client.get_server_info()
@@ -67,35 +104,44 @@ async def main():
         
         # Test console printing
         print("\n5. Testing console printing...")
-        
-        # Print text
-        output = await client.print_text("Hello from WebSocket!", bold=True)
-        if output:
-            print(f"   Text output: {repr(output.strip())}")
-        
-        # Print banner
-        banner_output = await client.print_banner("WEBSOCKET TEST", char="*", width=30)
-        if banner_output:
-            print("   Banner printed:")
-            for line in banner_output.strip().split('\n'):
-                print(f"     {line}")
-        
-        # Print table
+
+        # Pack the independent console prints into one ack-correlated
+        # batch frame; gathering the per-event calls would race on the
+        # client's shared last_response mailbox
         table_data = [
             ["Feature", "Status"],
             ["WebSocket", "✓ Working"],
             ["Socket.IO", "✓ Compatible"],
             ["Console Print", "✓ Tested"]
         ]
-        table_output = await client.print_table(table_data, headers=["Component", "Status"], title="Test Results")
+        items = ["Real-time communication", "Cross-platform support", "Easy integration"]
+
+        results = await client.batch([
+            {'fn': 'print_text', 'args': ["Hello from WebSocket!"], 'kwargs': {'bold': True}},
+            {'fn': 'print_banner', 'args': ["WEBSOCKET TEST"], 'kwargs': {'char': '*', 'width': 30}},
+            {'fn': 'print_table', 'args': [table_data],
+             'kwargs': {'headers': ["Component", "Status"], 'title': "Test Results"}},
+            {'fn': 'print_list', 'args': [items], 'kwargs': {'bullet': '→'}}
+        ])
+        if results is None:
+            results = [{}] * 4
+        output, banner_output, table_output, list_output = [
+            r.get('output') if r.get('success') else None for r in results
+        ]
+
+        if output:
+            print(f"   Text output: {repr(output.strip())}")
+
+        if banner_output:
+            print("   Banner printed:")
+            for line in banner_output.strip().split('\n'):
+                print(f"     {line}")
+
         if table_output:
             print("   Table printed:")
             for line in table_output.strip().split('\n'):
                 print(f"     {line}")
-        
-        # Print list
-        items = ["Real-time communication", "Cross-platform support", "Easy integration"]
-        list_output = await client.print_list(items, bullet="→")
+
         if list_output:
             print("   List printed:")
             for line in list_output.strip().split('\n'):
@@ -126,20 +172,11 @@ async def main():
             success = await client.print_hardware_qr_code("WebSocket Test QR Code", size=4)
             print(f"   QR code printing: {'✓ Success' if success else '✗ Failed'}")
             
-            # Print receipt
-            receipt_lines = [
-                "    WEBSOCKET TEST RECEIPT",
-                "    =====================",
-                "",
-                "Item: WebSocket Demo",
-                "Price: $0.00 (Free!)",
-                "",
-                "Total: $0.00",
-                "",
-                "Thank you for testing!",
-                ""
-            ]
-            success = await client.print_hardware_receipt(receipt_lines, cut_paper=True)
+            # Print receipt, using the pre-encoded payload when msgpack is available
+            if _RECEIPT_PAYLOAD is not None:
+                success = await client.print_hardware_receipt_raw(_RECEIPT_PAYLOAD)
+            else:
+                success = await client.print_hardware_receipt(RECEIPT_LINES, cut_paper=True)
             print(f"   Receipt printing: {'✓ Success' if success else '✗ Failed'}")
             
             # Test cash drawer
@@ -162,37 +199,65 @@ async def main():
         
     except Exception as e:
         print(f"\nError during testing: {e}")
+        import os
         import traceback
-        traceback.print_exc()
+        print("".join(traceback.format_exception_only(type(e), e)))
+        if os.environ.get("PYTEXTPRINTER_TRACE"):
+            traceback.print_exc()
         
     finally:
-        # Disconnect
-        print("\nDisconnecting...")
-        await client.disconnect()
-        print("✓ Disconnected")
+        # Disconnect only if this run owns the client
+        if owns_client:
+            print("\nDisconnecting...")
+            await client.disconnect()
+            print("✓ Disconnected")
 
 
-async def simple_example():
-    """Simple example showing basic usage."""
+async def simple_example(client=None):
+    """Simple example showing basic usage.
+
+    Args:
+        client: Optional already-connected client to reuse. When None,
+            a new client is created and connected for this run.
+    """
     print("\n" + "="*50)
     print("SIMPLE USAGE EXAMPLE")
     print("="*50)
-    
-    client = PyTextPrinterWebSocketClient('http://localhost:8080')
-    
+
+    owns_client = client is None
+    if owns_client:
+        client = PyTextPrinterWebSocketClient('http://localhost:8080')
+
     try:
         # Connect
-        await client.connect()
-        await asyncio.sleep(0.5)  # Wait for connection
-        
+        if owns_client:
+            await client.connect()
+
         # Print text
         output = await client.print_text("Simple WebSocket Test", bold=True)
         print(f"Output: {output}")
-        
+
         # List printers
         printers = await client.list_printers()
         print(f"Found {len(printers) if printers else 0} printers")
-        
+
+    finally:
+        if owns_client:
+            await client.disconnect()
+
+
+async def _entry():
+    """Run both examples over a single connected client."""
+    client = PyTextPrinterWebSocketClient('http://localhost:8080')
+
+    connected = await client.connect()
+    if not connected:
+        print("Failed to connect to server. Make sure the server is running.")
+        return
+
+    try:
+        await main(client)
+        await simple_example(client)
     finally:
         await client.disconnect()
 
@@ -202,13 +267,10 @@ if __name__ == "__main__":
         print("Make sure the WebSocket server is running first!")
         print("Run: python examples/websocket_server_example.py")
         print()
-        
-        # Run main example
-        asyncio.run(main())
-        
-        # Run simple example
-        asyncio.run(simple_example())
-        
+
+        # Run both examples over one connection
+        asyncio.run(_entry())
+
     except KeyboardInterrupt:
         print("\nClient stopped by user.")
     except Exception as e:
@@ -12,6 +12,13 @@ import signal
 import sys
 from pytextprinter.websocket_server import PyTextPrinterWebSocketServer
 
+# Use uvloop's faster event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 async def main():
     """Main function to run the WebSocket server."""
@@ -37,14 +44,19 @@ async def main():
     print(f"Web interface: http://localhost:8080")
     print(f"\nPress Ctrl+C to stop the server\n")
     
+    # Stop event set by the signal handlers below, so the event loop
+    # stays fully idle between requests instead of waking every second
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, stop.set)
+    loop.add_signal_handler(signal.SIGTERM, stop.set)
+
     try:
         await server.start_server()
-        
-        # Keep the server running
-        while True:
-            await asyncio.sleep(1)
-            
-    except KeyboardInterrupt:
+
+        # Keep the server running until a stop signal arrives
+        await stop.wait()
+
         print("\n\nShutting down server...")
     except Exception as e:
         print(f"Server error: {e}")
@@ -53,16 +65,7 @@ async def main():
         print("Server stopped.")
 
 
-def signal_handler(signum, frame):
-    """Handle Ctrl+C gracefully."""
-    print("\nReceived interrupt signal...")
-    sys.exit(0)
-
-
 if __name__ == "__main__":
-    # Handle Ctrl+C
-    signal.signal(signal.SIGINT, signal_handler)
-    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
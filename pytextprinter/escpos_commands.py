@@ -1,9 +1,27 @@
 """ESC/POS command module for sending raw commands to thermal and text printers."""
 
+import queue
 import struct
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Union, List, Optional, Tuple
 from enum import Enum
 
+# Prebuilt little-endian uint16 packer; avoids reparsing the format
+# string on every QR code
+_PACK_LEN_LE_H = struct.Struct('<H').pack
+
+
+@lru_cache(maxsize=1024)
+def _encode(text: str, encoding: str) -> bytes:
+    """Encode text for the printer, caching results for repeated strings.
+
+    Receipt boilerplate ("TOTAL", separators, blank lines) repeats heavily,
+    so hashing the string is far cheaper than re-encoding it each time.
+    """
+    return text.encode(encoding, errors='replace')
+
 
 class ESCPOSCommands:
     """ESC/POS command constants and utilities."""
@@ -86,6 +104,39 @@ class ESCPOSCommands:
     STATUS_PAPER = DLE + b'\x04' + b'\x04'
 
 
+# Module-level aliases for the commands the builder emits most often;
+# a plain module name load is cheaper than a class-attribute lookup
+_INIT = ESCPOSCommands.INIT
+_LF = ESCPOSCommands.LF
+_BOLD_ON = ESCPOSCommands.BOLD_ON
+_BOLD_OFF = ESCPOSCommands.BOLD_OFF
+_UNDERLINE_ON = ESCPOSCommands.UNDERLINE_ON
+_UNDERLINE_OFF = ESCPOSCommands.UNDERLINE_OFF
+_ITALIC_ON = ESCPOSCommands.ITALIC_ON
+_ITALIC_OFF = ESCPOSCommands.ITALIC_OFF
+_DOUBLE_HEIGHT_ON = ESCPOSCommands.DOUBLE_HEIGHT_ON
+_DOUBLE_WIDTH_ON = ESCPOSCommands.DOUBLE_WIDTH_ON
+_DOUBLE_SIZE_ON = ESCPOSCommands.DOUBLE_SIZE_ON
+_NORMAL_SIZE = ESCPOSCommands.NORMAL_SIZE
+_FEED_LINE = ESCPOSCommands.FEED_LINE
+_FEED_LINES = ESCPOSCommands.FEED_LINES
+_SET_LINE_SPACING = ESCPOSCommands.SET_LINE_SPACING
+_DEFAULT_LINE_SPACING = ESCPOSCommands.DEFAULT_LINE_SPACING
+_PAPER_CUT_FULL = ESCPOSCommands.PAPER_CUT_FULL
+_PAPER_CUT_PARTIAL = ESCPOSCommands.PAPER_CUT_PARTIAL
+_BARCODE_HEIGHT = ESCPOSCommands.BARCODE_HEIGHT
+_BARCODE_WIDTH = ESCPOSCommands.BARCODE_WIDTH
+_PRINT_BARCODE = ESCPOSCommands.PRINT_BARCODE
+_QR_MODEL = ESCPOSCommands.QR_MODEL
+_QR_MODEL_2 = ESCPOSCommands.QR_MODEL + b'\x02'
+_QR_SIZE = ESCPOSCommands.QR_SIZE
+_QR_ERROR_CORRECTION = ESCPOSCommands.QR_ERROR_CORRECTION
+_QR_STORE_DATA = ESCPOSCommands.QR_STORE_DATA
+_QR_PRINT = ESCPOSCommands.QR_PRINT
+_OPEN_DRAWER_1 = ESCPOSCommands.OPEN_DRAWER_1
+_OPEN_DRAWER_2 = ESCPOSCommands.OPEN_DRAWER_2
+
+
 class TextAlignment(Enum):
     """Text alignment options."""
     LEFT = 0
@@ -106,25 +157,173 @@ class BarcodeType(Enum):
     CODE128 = 8
 
 
+# Preformed one-byte payload per barcode type; a dict hit replaces the
+# enum .value attribute lookup plus bytes() construction per call
+_BT_BYTE = {bt: bytes((bt.value,)) for bt in BarcodeType}
+
+# Dispatch tables built once at import; the builder methods below do a
+# single dict lookup instead of branching or rebuilding a dict per call
+_ALIGN_CMD = {
+    TextAlignment.LEFT: ESCPOSCommands.ALIGN_LEFT,
+    TextAlignment.CENTER: ESCPOSCommands.ALIGN_CENTER,
+    TextAlignment.RIGHT: ESCPOSCommands.ALIGN_RIGHT
+}
+
+_CHARSET_CMD = {
+    'usa': ESCPOSCommands.SELECT_CHARSET_USA,
+    'france': ESCPOSCommands.SELECT_CHARSET_FRANCE,
+    'germany': ESCPOSCommands.SELECT_CHARSET_GERMANY,
+    'uk': ESCPOSCommands.SELECT_CHARSET_UK
+}
+
+_CODEPAGE_CMD = {
+    'cp437': ESCPOSCommands.SELECT_CODEPAGE_CP437,
+    'cp850': ESCPOSCommands.SELECT_CODEPAGE_CP850,
+    'cp858': ESCPOSCommands.SELECT_CODEPAGE_CP858,
+    'win1252': ESCPOSCommands.SELECT_CODEPAGE_WIN1252
+}
+
+_STATUS_CMD = {
+    'printer': ESCPOSCommands.STATUS_PRINTER,
+    'offline': ESCPOSCommands.STATUS_OFFLINE,
+    'error': ESCPOSCommands.STATUS_ERROR,
+    'paper': ESCPOSCommands.STATUS_PAPER
+}
+
+
+# Frozen prologue/epilogue sequences for common receipt shapes; preset()
+# replays one with a single append instead of several builder calls
+_PRESETS = {
+    'receipt_header': (_INIT + ESCPOSCommands.SELECT_CHARSET_USA
+                       + ESCPOSCommands.SELECT_CODEPAGE_CP437
+                       + ESCPOSCommands.ALIGN_CENTER + _BOLD_ON),
+    'receipt_footer': (_NORMAL_SIZE + ESCPOSCommands.ALIGN_LEFT
+                       + _BOLD_OFF + _PAPER_CUT_FULL)
+}
+
+
+class _WriterThread:
+    """Background writer that drains queued send jobs in order.
+
+    Building commands is fast but pushing them to the printer blocks, so
+    callers can hand a payload off here and keep assembling the next
+    receipt while the previous one is still being sent.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, send_fn, payload: bytes) -> Future:
+        """Queue a payload for sending and return a Future for the result."""
+        future = Future()
+        self._queue.put((send_fn, payload, future))
+        self._ensure_thread()
+        return future
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            send_fn, payload, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(send_fn(payload))
+            except Exception as e:
+                future.set_exception(e)
+
+
+_writer = _WriterThread()
+
+
 class ESCPOSCommandBuilder:
     """Builder class for creating ESC/POS command sequences."""
     
     def __init__(self):
         """Initialize the command builder."""
-        self.commands = bytearray()
-    
+        # Command fragments are collected by reference and joined once in
+        # get_commands(), avoiding incremental buffer growth
+        self._parts: List[bytes] = []
+
+    @property
+    def commands(self) -> bytes:
+        """The built command sequence, materialized on demand."""
+        return b''.join(self._parts)
+
     def clear(self) -> 'ESCPOSCommandBuilder':
         """Clear all commands."""
-        self.commands.clear()
+        self._parts.clear()
         return self
-    
+
     def get_commands(self) -> bytes:
         """Get the built command sequence."""
-        return bytes(self.commands)
+        return b''.join(self._parts)
+
+    def send_async(self, send_fn) -> Future:
+        """Send the built commands through a background writer thread.
+
+        The current buffer is snapshot and queued for the shared writer,
+        so the caller can clear() and start building the next job while
+        this one is still going out over the slow printer link.
+
+        Args:
+            send_fn: Callable taking the command bytes and performing the
+                actual send, e.g. a bound
+                PrinterInterface.send_raw_data(printer_name, ...) partial
+
+        Returns:
+            Future resolving to send_fn's return value
+        """
+        return _writer.submit(send_fn, self.get_commands())
+
+    @staticmethod
+    def clear_encode_cache() -> None:
+        """Drop cached text encodings (for long-running processes)."""
+        _encode.cache_clear()
+
+    def _emit(self, *parts: bytes) -> 'ESCPOSCommandBuilder':
+        """Collect the given parts for the deferred final join."""
+        self._parts.extend(parts)
+        return self
+
+    def preset(self, name: str) -> 'ESCPOSCommandBuilder':
+        """Emit a frozen command sequence registered under the given name.
+
+        Args:
+            name: Preset name ('receipt_header', 'receipt_footer', or one
+                added via register_preset())
+
+        Raises:
+            KeyError: If no preset is registered under the name
+        """
+        self._parts.append(_PRESETS[name])
+        return self
+
+    @staticmethod
+    def register_preset(name: str, builder_fn) -> None:
+        """Register a custom preset for later use with preset().
+
+        The builder function runs once against a fresh builder and its
+        output is frozen, so replaying the preset costs a single append.
+
+        Args:
+            name: Preset name
+            builder_fn: Callable that receives an ESCPOSCommandBuilder
+                and chains the commands the preset should contain
+        """
+        builder = ESCPOSCommandBuilder()
+        builder_fn(builder)
+        _PRESETS[name] = builder.get_commands()
     
     def init_printer(self) -> 'ESCPOSCommandBuilder':
         """Initialize the printer."""
-        self.commands.extend(ESCPOSCommands.INIT)
+        self._parts.append(_INIT)
         return self
     
     def text(self, text: str, encoding: str = 'cp437') -> 'ESCPOSCommandBuilder':
@@ -134,13 +333,11 @@ class ESCPOSCommandBuilder:
             text: Text to print
             encoding: Character encoding to use
         """
-        try:
-            encoded_text = text.encode(encoding)
-            self.commands.extend(encoded_text)
-        except UnicodeEncodeError:
-            # Fallback to UTF-8 with error replacement
-            encoded_text = text.encode('utf-8', errors='replace')
-            self.commands.extend(encoded_text)
+        if text.isascii():
+            # ASCII is a subset of every supported code page; skip the codec
+            self._parts.append(text.encode('ascii'))
+            return self
+        self._parts.append(_encode(text, encoding))
         return self
     
     def line(self, text: str = "", encoding: str = 'cp437') -> 'ESCPOSCommandBuilder':
@@ -152,70 +349,67 @@ class ESCPOSCommandBuilder:
         """
         if text:
             self.text(text, encoding)
-        self.commands.extend(ESCPOSCommands.LF)
+        self._parts.append(_LF)
         return self
     
     def bold(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set bold text formatting."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.BOLD_ON)
+            self._parts.append(_BOLD_ON)
         else:
-            self.commands.extend(ESCPOSCommands.BOLD_OFF)
+            self._parts.append(_BOLD_OFF)
         return self
     
     def underline(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set underline text formatting."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.UNDERLINE_ON)
+            self._parts.append(_UNDERLINE_ON)
         else:
-            self.commands.extend(ESCPOSCommands.UNDERLINE_OFF)
+            self._parts.append(_UNDERLINE_OFF)
         return self
     
     def italic(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set italic text formatting."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.ITALIC_ON)
+            self._parts.append(_ITALIC_ON)
         else:
-            self.commands.extend(ESCPOSCommands.ITALIC_OFF)
+            self._parts.append(_ITALIC_OFF)
         return self
     
     def double_height(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set double height text."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.DOUBLE_HEIGHT_ON)
+            self._parts.append(_DOUBLE_HEIGHT_ON)
         else:
-            self.commands.extend(ESCPOSCommands.NORMAL_SIZE)
+            self._parts.append(_NORMAL_SIZE)
         return self
     
     def double_width(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set double width text."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.DOUBLE_WIDTH_ON)
+            self._parts.append(_DOUBLE_WIDTH_ON)
         else:
-            self.commands.extend(ESCPOSCommands.NORMAL_SIZE)
+            self._parts.append(_NORMAL_SIZE)
         return self
     
     def double_size(self, enabled: bool = True) -> 'ESCPOSCommandBuilder':
         """Set double size (width and height) text."""
         if enabled:
-            self.commands.extend(ESCPOSCommands.DOUBLE_SIZE_ON)
+            self._parts.append(_DOUBLE_SIZE_ON)
         else:
-            self.commands.extend(ESCPOSCommands.NORMAL_SIZE)
+            self._parts.append(_NORMAL_SIZE)
         return self
     
     def normal_size(self) -> 'ESCPOSCommandBuilder':
         """Reset text to normal size."""
-        self.commands.extend(ESCPOSCommands.NORMAL_SIZE)
+        self._parts.append(_NORMAL_SIZE)
         return self
     
     def align(self, alignment: TextAlignment) -> 'ESCPOSCommandBuilder':
         """Set text alignment."""
-        if alignment == TextAlignment.LEFT:
-            self.commands.extend(ESCPOSCommands.ALIGN_LEFT)
-        elif alignment == TextAlignment.CENTER:
-            self.commands.extend(ESCPOSCommands.ALIGN_CENTER)
-        elif alignment == TextAlignment.RIGHT:
-            self.commands.extend(ESCPOSCommands.ALIGN_RIGHT)
+        command = _ALIGN_CMD.get(alignment)
+        if command is not None:
+            self._parts.append(command)
         return self
     
     def align_left(self) -> 'ESCPOSCommandBuilder':
@@ -235,11 +429,9 @@ class ESCPOSCommandBuilder:
         if lines <= 0:
             return self
         elif lines == 1:
-            self.commands.extend(ESCPOSCommands.FEED_LINE)
-        else:
-            self.commands.extend(ESCPOSCommands.FEED_LINES)
-            self.commands.append(min(lines, 255))
-        return self
+            self._parts.append(_FEED_LINE)
+            return self
+        return self._emit(_FEED_LINES, bytes((min(lines, 255),)))
     
     def set_line_spacing(self, spacing: int) -> 'ESCPOSCommandBuilder':
         """Set line spacing.
@@ -247,21 +439,19 @@ class ESCPOSCommandBuilder:
         Args:
             spacing: Line spacing value (0-255)
         """
-        self.commands.extend(ESCPOSCommands.SET_LINE_SPACING)
-        self.commands.append(max(0, min(spacing, 255)))
-        return self
+        return self._emit(_SET_LINE_SPACING, bytes((max(0, min(spacing, 255)),)))
     
     def default_line_spacing(self) -> 'ESCPOSCommandBuilder':
         """Reset to default line spacing."""
-        self.commands.extend(ESCPOSCommands.DEFAULT_LINE_SPACING)
+        self._parts.append(_DEFAULT_LINE_SPACING)
         return self
     
     def paper_cut(self, full_cut: bool = True) -> 'ESCPOSCommandBuilder':
         """Cut paper."""
         if full_cut:
-            self.commands.extend(ESCPOSCommands.PAPER_CUT_FULL)
+            self._parts.append(_PAPER_CUT_FULL)
         else:
-            self.commands.extend(ESCPOSCommands.PAPER_CUT_PARTIAL)
+            self._parts.append(_PAPER_CUT_PARTIAL)
         return self
     
     def barcode(self, data: str, barcode_type: BarcodeType = BarcodeType.CODE128,
@@ -273,23 +463,45 @@ class ESCPOSCommandBuilder:
             barcode_type: Type of barcode
             height: Barcode height (1-255)
             width: Barcode width (2-6)
+
+        Raises:
+            ValueError: If data contains non-ASCII characters
         """
-        # Set barcode height
-        self.commands.extend(ESCPOSCommands.BARCODE_HEIGHT)
-        self.commands.append(max(1, min(height, 255)))
-        
-        # Set barcode width
-        self.commands.extend(ESCPOSCommands.BARCODE_WIDTH)
-        self.commands.append(max(2, min(width, 6)))
-        
-        # Print barcode
-        self.commands.extend(ESCPOSCommands.PRINT_BARCODE)
-        self.commands.append(barcode_type.value)
-        self.commands.extend(data.encode('ascii'))
-        self.commands.append(0)  # Null terminator
-        
+        # Barcode data is ASCII by spec; the C-level flag check up front is
+        # cheaper than letting the encode's error machinery catch it
+        if not data.isascii():
+            raise ValueError('barcode data must be ASCII')
+
+        # Height, width, then the barcode itself with its null terminator,
+        # in one batched write
+        return self._emit(
+            _BARCODE_HEIGHT, bytes((max(1, min(height, 255)),)),
+            _BARCODE_WIDTH, bytes((max(2, min(width, 6)),)),
+            _PRINT_BARCODE, _BT_BYTE[barcode_type],
+            data.encode('ascii'), b'\x00')
+    
+    def barcodes_bulk(self, items: List[Tuple[str, BarcodeType, int, int]]) -> 'ESCPOSCommandBuilder':
+        """Print a batch of barcodes with one buffer append.
+
+        Args:
+            items: List of (data, barcode_type, height, width) tuples
+
+        Raises:
+            ValueError: If any barcode data contains non-ASCII characters
+        """
+        # Validate the whole batch first; map keeps the scan in C
+        if not all(map(str.isascii, (item[0] for item in items))):
+            raise ValueError('barcode data must be ASCII')
+
+        self._parts.extend(
+            b''.join((
+                _BARCODE_HEIGHT, bytes((max(1, min(height, 255)),)),
+                _BARCODE_WIDTH, bytes((max(2, min(width, 6)),)),
+                _PRINT_BARCODE, _BT_BYTE[barcode_type],
+                data.encode('ascii'), b'\x00'))
+            for data, barcode_type, height, width in items)
         return self
-    
+
     def qr_code(self, data: str, size: int = 3, error_correction: int = 1) -> 'ESCPOSCommandBuilder':
         """Print a QR code.
         
@@ -298,29 +510,16 @@ class ESCPOSCommandBuilder:
             size: QR code size (1-16)
             error_correction: Error correction level (0-3)
         """
-        # Set QR code model
-        self.commands.extend(ESCPOSCommands.QR_MODEL + b'\x02')
-        
-        # Set QR code size
-        self.commands.extend(ESCPOSCommands.QR_SIZE)
-        self.commands.append(max(1, min(size, 16)))
-        
-        # Set error correction level
-        self.commands.extend(ESCPOSCommands.QR_ERROR_CORRECTION)
-        self.commands.append(max(0, min(error_correction, 3)))
-        
-        # Store QR code data
+        # Model, size, error correction, data store and print, in one
+        # batched write
         data_bytes = data.encode('utf-8')
-        data_length = len(data_bytes) + 3
-        self.commands.extend(ESCPOSCommands.QR_STORE_DATA)
-        self.commands.extend(struct.pack('<H', data_length))
-        self.commands.extend(b'1P0')
-        self.commands.extend(data_bytes)
-        
-        # Print QR code
-        self.commands.extend(ESCPOSCommands.QR_PRINT)
-        
-        return self
+        return self._emit(
+            _QR_MODEL_2,
+            _QR_SIZE, bytes((max(1, min(size, 16)),)),
+            _QR_ERROR_CORRECTION, bytes((max(0, min(error_correction, 3)),)),
+            _QR_STORE_DATA, _PACK_LEN_LE_H(len(data_bytes) + 3),
+            b'1P0', data_bytes,
+            _QR_PRINT)
     
     def open_drawer(self, drawer_number: int = 1) -> 'ESCPOSCommandBuilder':
         """Open cash drawer.
@@ -329,9 +528,9 @@ class ESCPOSCommandBuilder:
             drawer_number: Drawer number (1 or 2)
         """
         if drawer_number == 2:
-            self.commands.extend(ESCPOSCommands.OPEN_DRAWER_2)
+            self._parts.append(_OPEN_DRAWER_2)
         else:
-            self.commands.extend(ESCPOSCommands.OPEN_DRAWER_1)
+            self._parts.append(_OPEN_DRAWER_1)
         return self
     
     def raw_command(self, command: bytes) -> 'ESCPOSCommandBuilder':
@@ -340,7 +539,7 @@ class ESCPOSCommandBuilder:
         Args:
             command: Raw command bytes
         """
-        self.commands.extend(command)
+        self._parts.append(command)
         return self
     
     def status_request(self, status_type: str = 'printer') -> 'ESCPOSCommandBuilder':
@@ -349,15 +548,8 @@ class ESCPOSCommandBuilder:
         Args:
             status_type: Type of status to request ('printer', 'offline', 'error', 'paper')
         """
-        status_commands = {
-            'printer': ESCPOSCommands.STATUS_PRINTER,
-            'offline': ESCPOSCommands.STATUS_OFFLINE,
-            'error': ESCPOSCommands.STATUS_ERROR,
-            'paper': ESCPOSCommands.STATUS_PAPER
-        }
-        
-        command = status_commands.get(status_type, ESCPOSCommands.STATUS_PRINTER)
-        self.commands.extend(command)
+        command = _STATUS_CMD.get(status_type, ESCPOSCommands.STATUS_PRINTER)
+        self._parts.append(command)
         return self
     
     def charset(self, charset: str = 'usa') -> 'ESCPOSCommandBuilder':
@@ -366,15 +558,8 @@ class ESCPOSCommandBuilder:
         Args:
             charset: Character set name ('usa', 'france', 'germany', 'uk')
         """
-        charset_commands = {
-            'usa': ESCPOSCommands.SELECT_CHARSET_USA,
-            'france': ESCPOSCommands.SELECT_CHARSET_FRANCE,
-            'germany': ESCPOSCommands.SELECT_CHARSET_GERMANY,
-            'uk': ESCPOSCommands.SELECT_CHARSET_UK
-        }
-        
-        command = charset_commands.get(charset.lower(), ESCPOSCommands.SELECT_CHARSET_USA)
-        self.commands.extend(command)
+        command = _CHARSET_CMD.get(charset.lower(), ESCPOSCommands.SELECT_CHARSET_USA)
+        self._parts.append(command)
         return self
     
     def codepage(self, codepage: str = 'cp437') -> 'ESCPOSCommandBuilder':
@@ -383,13 +568,6 @@ class ESCPOSCommandBuilder:
         Args:
             codepage: Code page name ('cp437', 'cp850', 'cp858', 'win1252')
         """
-        codepage_commands = {
-            'cp437': ESCPOSCommands.SELECT_CODEPAGE_CP437,
-            'cp850': ESCPOSCommands.SELECT_CODEPAGE_CP850,
-            'cp858': ESCPOSCommands.SELECT_CODEPAGE_CP858,
-            'win1252': ESCPOSCommands.SELECT_CODEPAGE_WIN1252
-        }
-        
-        command = codepage_commands.get(codepage.lower(), ESCPOSCommands.SELECT_CODEPAGE_CP437)
-        self.commands.extend(command)
+        command = _CODEPAGE_CMD.get(codepage.lower(), ESCPOSCommands.SELECT_CODEPAGE_CP437)
+        self._parts.append(command)
         return self
\ No newline at end of file
@@ -1,7 +1,36 @@
 """Text formatting utilities for tables, banners, and other layouts."""
 
+import io
+import re
+from functools import lru_cache
+from itertools import starmap
 from typing import List, Optional
 
+# Precompiled matcher for ANSI SGR escape sequences (e.g. bold from
+# TextPrinter.print_text); these occupy bytes but no columns on screen
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences from text.
+
+    Args:
+        text: Text possibly containing ANSI escape sequences
+
+    Returns:
+        Text with all ANSI sequences removed
+    """
+    # C-level containment check short-circuits the common plain-text case
+    if '\x1b' in text:
+        return _ANSI_RE.sub('', text)
+    return text
+
+
+@lru_cache(maxsize=128)
+def _border(char: str, width: int) -> str:
+    """Return a cached border line for the given character and width."""
+    return char * width
+
 
 class TableFormatter:
     """Formatter for creating ASCII tables."""
@@ -20,46 +49,79 @@ class TableFormatter:
         """
         if not data:
             return ""
-        
-        # Combine headers and data for width calculation
+
+        # Combine headers and data, stringifying every cell exactly once
         all_rows = []
         if headers:
             all_rows.append(headers)
         all_rows.extend(data)
-        
-        # Calculate column widths
-        col_widths = []
-        for col_idx in range(len(all_rows[0])):
-            width = max(len(str(row[col_idx])) for row in all_rows if col_idx < len(row))
-            col_widths.append(width)
-        
-        # Create table
-        lines = []
-        
+        str_rows = [[str(cell) for cell in row] for row in all_rows]
+
+        # Normalize ragged rows so the transpose lines up column-wise;
+        # the first row defines the column count
+        num_cols = len(str_rows[0])
+        for row in str_rows:
+            if len(row) < num_cols:
+                row.extend([''] * (num_cols - len(row)))
+            elif len(row) > num_cols:
+                del row[num_cols:]
+
+        # Calculate column widths in one pass per column. Cells carrying
+        # ANSI escapes are measured by on-screen width, not byte count
+        has_ansi = any('\x1b' in cell for row in str_rows for cell in row)
+        if has_ansi:
+            col_widths = [max(len(strip_ansi(cell)) for cell in col)
+                          for col in zip(*str_rows)]
+        else:
+            col_widths = [max(map(len, col)) for col in zip(*str_rows)]
+
+        # Write the table into one buffer instead of collecting a line list
+        buf = io.StringIO()
+        write = buf.write
+
         # Add title if provided
         if title:
-            total_width = sum(col_widths) + 3 * (len(col_widths) - 1) + 4
-            lines.append("+" + "-" * (total_width - 2) + "+")
-            title_line = f"| {title:^{total_width - 4}} |"
-            lines.append(title_line)
-        
+            total_width = sum(col_widths) + 3 * (num_cols - 1) + 4
+            write("+" + "-" * (total_width - 2) + "+\n")
+            write(f"| {title:^{total_width - 4}} |\n")
+
         # Create separator line
         separator = "+" + "+".join("-" * (width + 2) for width in col_widths) + "+"
-        lines.append(separator)
-        
-        # Add headers if provided
-        if headers:
-            header_line = "|" + "|".join(f" {headers[i]:<{col_widths[i]}} " for i in range(len(headers))) + "|"
-            lines.append(header_line)
-            lines.append(separator)
-        
-        # Add data rows
-        for row in data:
-            row_line = "|" + "|".join(f" {str(row[i]):<{col_widths[i]}} " if i < len(row) else f" {'':<{col_widths[i]}} " for i in range(len(col_widths))) + "|"
-            lines.append(row_line)
-        
-        lines.append(separator)
-        return "\n".join(lines)
+        write(separator)
+        write("\n")
+
+        body_rows = str_rows
+        if has_ansi:
+            # Pad by visible width: format specs would count escape bytes
+            # and under-pad colored cells
+            def render_row(row):
+                return "| " + " | ".join(
+                    cell + " " * (width - len(strip_ansi(cell)))
+                    for cell, width in zip(row, col_widths)) + " |\n"
+
+            if headers:
+                write(render_row(str_rows[0]))
+                write(separator)
+                write("\n")
+                body_rows = str_rows[1:]
+            write("".join(map(render_row, body_rows)))
+        else:
+            # Row template built once, so the format spec is parsed once
+            # per table
+            row_fmt = ("| " + " | ".join("{:<%d}" % width for width in col_widths)
+                       + " |\n")
+
+            if headers:
+                write(row_fmt.format(*str_rows[0]))
+                write(separator)
+                write("\n")
+                body_rows = str_rows[1:]
+
+            # starmap drives the render loop in C, which matters on large tables
+            write("".join(starmap(row_fmt.format, body_rows)))
+
+        write(separator)
+        return buf.getvalue()
 
 
 class BannerFormatter:
@@ -81,10 +143,11 @@ class BannerFormatter:
         if width < min_width:
             width = min_width
         
-        border = char * width
+        border = _border(char, width)
         padding = (width - len(text) - 2) // 2
-        text_line = char + ' ' * padding + text + ' ' * (width - len(text) - padding - 2) + char
-        
+        text_line = "".join((char, ' ' * padding, text,
+                             ' ' * (width - len(text) - padding - 2), char))
+
         return f"{border}\n{text_line}\n{border}"
     
     def create_simple_banner(self, text: str, char: str = '-') -> str:
@@ -1,17 +1,72 @@
 """Main text printer class with various printing utilities."""
 
+import codecs
 import sys
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from typing import Optional, Union, List, Dict, Any
 from .formatters import TableFormatter, BannerFormatter
 from .printer_manager import PrinterManager
-from .printer_interface import PrinterInterface
+from .printer_interface import PrinterInterface, _to_thread
 from .escpos_commands import ESCPOSCommandBuilder, TextAlignment, BarcodeType
 from .printer_discovery import PrinterInfo
 
+# ANSI escape sequences for bold emphasis, built once at import time
+_ANSI_BOLD = '\033[1m'
+_ANSI_RESET = '\033[0m'
+
+# Frozen ESC/POS prologues/epilogues for the hardware helpers, built once
+# at import; per call only the variable middle section is assembled
+_BANNER_PREFIX = (ESCPOSCommandBuilder().init_printer().align_center()
+                  .bold(True).get_commands())
+_BANNER_SUFFIX = (ESCPOSCommandBuilder().bold(False).align_left()
+                  .feed_lines(2).get_commands())
+_CENTERED_PREFIX = ESCPOSCommandBuilder().init_printer().align_center().get_commands()
+_CENTERED_SUFFIX = ESCPOSCommandBuilder().align_left().feed_lines(3).get_commands()
+
+
+@lru_cache(maxsize=32)
+def _border_bytes(char: str, width: int) -> bytes:
+    """Encoded banner border line, cached per (char, width) pair.
+
+    Applications typically reuse one or two border styles for life, so
+    repeat banners skip both the string multiply and the encode.
+    """
+    return (char * width + '\n').encode('cp437', errors='replace')
+
+
+def _require_printer(func):
+    """Guard a hardware method behind the cached printer selection.
+
+    The wrapped method receives the selected PrinterInfo as its first
+    argument; when nothing is selected the call reports the error and
+    returns False without entering the method body.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        selected_printer = self._selected_printer
+        if selected_printer is None:
+            print("Error: No printer selected. Use select_printer() first.")
+            return False
+        return func(self, selected_printer, *args, **kwargs)
+    return wrapper
+
+
+# The console test page is entirely constant; render it once at import
+_TEST_PAGE = (BannerFormatter().create_banner("PyTextPrinter Test Page")
+              + "\nThis is a test page to verify functionality.\n"
+              "Console output is working correctly.\n")
+
 
 class TextPrinter:
     """Main class for printing formatted text with colors and styles."""
-    
+
+    # Fixed attribute set: drops the per-instance __dict__ and makes the
+    # self.output/self.escpos reads in hot loops a C-level slot access
+    __slots__ = ('output', 'table_formatter', 'banner_formatter',
+                 'printer_manager', 'printer_interface', 'escpos',
+                 '_selected_printer', '_pbar_cache', '_cp437_encode')
+
     def __init__(self, output=None):
         """Initialize TextPrinter.
         
@@ -26,6 +81,15 @@ class TextPrinter:
         self.printer_manager = PrinterManager()
         self.printer_interface = PrinterInterface()
         self.escpos = ESCPOSCommandBuilder()
+        # Selection cached here so hot hardware methods read an attribute
+        # instead of dispatching through the manager on every call
+        self._selected_printer: Optional[PrinterInfo] = None
+        # Progress-bar templates keyed by (char, empty_char, width); each
+        # frame slices one instead of rebuilding both halves of the bar
+        self._pbar_cache: Dict[tuple, str] = {}
+        # Resolved once; the hardware text paths encode whole payloads in
+        # a single C-level pass through this encoder
+        self._cp437_encode = codecs.getencoder('cp437')
     
     def print_text(self, text: str, bold: bool = False, end: str = '\n') -> None:
         """Print text with optional bold formatting.
@@ -35,52 +99,113 @@ class TextPrinter:
             bold: Whether to make text bold (using ANSI codes)
             end: String appended after the text
         """
+        # Write straight to the stream; print()'s argument handling is
+        # measurable overhead on line-at-a-time output
         if bold:
-            formatted_text = f"\033[1m{text}\033[0m"
+            self.output.write(f"{_ANSI_BOLD}{text}{_ANSI_RESET}{end}")
         else:
-            formatted_text = text
-            
-        print(formatted_text, end=end, file=self.output)
+            self.output.write(f"{text}{end}")
     
+    def format_banner(self, text: str, char: str = '=', width: int = 50) -> str:
+        """Format a banner without printing it.
+
+        Args:
+            text: Text for the banner
+            char: Character to use for the banner border
+            width: Width of the banner
+
+        Returns:
+            Formatted banner as string
+        """
+        return self.banner_formatter.create_banner(text, char, width)
+
     def print_banner(self, text: str, char: str = '=', width: int = 50) -> None:
         """Print a banner with the given text.
-        
+
         Args:
             text: Text for the banner
             char: Character to use for the banner border
             width: Width of the banner
         """
-        banner = self.banner_formatter.create_banner(text, char, width)
-        print(banner, file=self.output)
-    
+        self.output.write(self.format_banner(text, char, width) + '\n')
+
+    def format_table(self, data: List[List[str]], headers: Optional[List[str]] = None,
+                    title: Optional[str] = None) -> str:
+        """Format data as a table without printing it.
+
+        Args:
+            data: 2D list of table data
+            headers: Optional list of column headers
+            title: Optional table title
+
+        Returns:
+            Formatted table as string
+        """
+        return self.table_formatter.format_table(data, headers, title)
+
     def print_table(self, data: List[List[str]], headers: Optional[List[str]] = None,
                    title: Optional[str] = None) -> None:
         """Print data in a formatted table.
-        
+
         Args:
             data: 2D list of table data
             headers: Optional list of column headers
             title: Optional table title
         """
-        table = self.table_formatter.format_table(data, headers, title)
-        print(table, file=self.output)
+        self.output.write(self.format_table(data, headers, title) + '\n')
     
-    def print_progress_bar(self, progress: float, width: int = 50, 
-                          char: str = '█', empty_char: str = '░') -> None:
+    def print_progress_bar(self, progress: float, width: int = 50,
+                          char: str = '█', empty_char: str = '░',
+                          flush: bool = True) -> None:
         """Print a progress bar.
-        
+
         Args:
             progress: Progress value between 0.0 and 1.0
             width: Width of the progress bar
             char: Character for filled portions
             empty_char: Character for empty portions
+            flush: Whether to flush the output stream; callers updating the
+                bar rapidly can defer flushing to the final frame
         """
-        filled_width = int(width * progress)
-        bar = char * filled_width + empty_char * (width - filled_width)
-        percentage = progress * 100
-        progress_text = f"[{bar}] {percentage:.1f}%"
-        print(f"\r{progress_text}", end='', file=self.output)
+        key = (char, empty_char, width)
+        template = self._pbar_cache.get(key)
+        if template is None:
+            template = self._pbar_cache.setdefault(key, char * width + empty_char * width)
+
+        # Any fill level is a window into the template: filled chars on the
+        # left, empties on the right, so one slice replaces two multiplies
+        # and a concat per frame. Clamp first: out-of-range progress would
+        # push the slice start negative and render an empty bar
+        filled_width = max(0, min(width, int(width * progress)))
+        bar = template[width - filled_width:2 * width - filled_width]
+
+        # Separate writes skip assembling a throwaway frame string; the
+        # buffered stream coalesces them anyway
+        write = self.output.write
+        write('\r[')
+        write(bar)
+        write('] ')
+        write('%.1f%%' % (progress * 100))
+        if flush:
+            self.output.flush()
     
+    def print_lines(self, lines: List[str], bold: bool = False) -> None:
+        """Print a batch of lines with a single stream write.
+
+        Args:
+            lines: Lines to print
+            bold: Whether to make the lines bold (using ANSI codes)
+        """
+        if not lines:
+            return
+        # Join once and write once; per-line print() calls each take the
+        # stream lock and dispatch separately
+        if bold:
+            blob = ''.join(f"{_ANSI_BOLD}{line}{_ANSI_RESET}\n" for line in lines)
+        else:
+            blob = '\n'.join(lines) + '\n'
+        self.output.write(blob)
+
     def print_list(self, items: List[str], bullet: str = '•') -> None:
         """Print a formatted list.
         
@@ -88,8 +213,9 @@ class TextPrinter:
             items: List of items to print
             bullet: Bullet character
         """
-        for item in items:
-            print(f"{bullet} {item}", file=self.output)
+        # One writelines call replaces a print() dispatch per item
+        prefix = f"{bullet} "
+        self.output.writelines(f"{prefix}{item}\n" for item in items)
     
     def print_dict(self, data: Dict[str, Any], indent: int = 2) -> None:
         """Print a dictionary in a formatted way.
@@ -98,9 +224,15 @@ class TextPrinter:
             data: Dictionary to print
             indent: Indentation level
         """
-        for key, value in data.items():
-            spaces = ' ' * indent
-            print(f"{spaces}{key}: {value}", file=self.output)
+        # The indent string is loop-invariant; build it once
+        spaces = ' ' * indent
+        write = self.output.write
+        if all(type(value) is str for value in data.values()):
+            # All-string dicts (the common case) take one join and one write
+            write(''.join(f"{spaces}{key}: {value}\n" for key, value in data.items()))
+        else:
+            for key, value in data.items():
+                write(f"{spaces}{key}: {value}\n")
     
     # Hardware Printer Methods
     def list_printers(self, text_only: bool = True, refresh: bool = False) -> List[PrinterInfo]:
@@ -127,7 +259,9 @@ class TextPrinter:
         Returns:
             True if printer was successfully selected, False otherwise
         """
-        return self.printer_manager.select_printer(printer_name)
+        selected = self.printer_manager.select_printer(printer_name)
+        self._selected_printer = self.printer_manager.get_selected_printer()
+        return selected
     
     def select_printer_interactive(self, text_only: bool = True) -> bool:
         """Interactively select a printer from available printers.
@@ -138,7 +272,9 @@ class TextPrinter:
         Returns:
             True if a printer was selected, False otherwise
         """
-        return self.printer_manager.select_printer_interactive(text_only)
+        selected = self.printer_manager.select_printer_interactive(text_only)
+        self._selected_printer = self.printer_manager.get_selected_printer()
+        return selected
     
     def auto_select_printer(self) -> bool:
         """Automatically select the first available text printer.
@@ -146,7 +282,9 @@ class TextPrinter:
         Returns:
             True if a printer was selected, False otherwise
         """
-        return self.printer_manager.auto_select_text_printer()
+        selected = self.printer_manager.auto_select_text_printer()
+        self._selected_printer = self.printer_manager.get_selected_printer()
+        return selected
     
     def get_selected_printer(self) -> Optional[PrinterInfo]:
         """Get information about the currently selected printer.
@@ -154,9 +292,11 @@ class TextPrinter:
         Returns:
             Selected printer info, or None if no printer is selected
         """
-        return self.printer_manager.get_selected_printer()
+        return self._selected_printer
     
-    def print_to_hardware(self, text: str, encoding: str = 'cp437') -> bool:
+    @_require_printer
+    def print_to_hardware(self, selected_printer: PrinterInfo, text: str,
+                          encoding: str = 'cp437') -> bool:
         """Print text to the selected hardware printer.
         
         Args:
@@ -166,14 +306,17 @@ class TextPrinter:
         Returns:
             True if printing was successful, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        return self.printer_interface.send_text(selected_printer.name, text, encoding)
+        # Encode here in one pass and use the bytes API; send_text would
+        # re-run codec resolution and its own fallback handling
+        if encoding == 'cp437':
+            data, _ = self._cp437_encode(text, 'replace')
+        else:
+            data = text.encode(encoding, errors='replace')
+        return self.printer_interface.send_raw_data(selected_printer.name, data)
     
-    def send_escpos_to_hardware(self, commands: bytes) -> bool:
+    @_require_printer
+    def send_escpos_to_hardware(self, selected_printer: PrinterInfo,
+                                commands: bytes) -> bool:
         """Send raw ESC/POS commands to the selected hardware printer.
         
         Args:
@@ -182,14 +325,33 @@ class TextPrinter:
         Returns:
             True if commands were sent successfully, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
         return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
-    def print_hardware_banner(self, text: str, char: str = '=', width: int = 32) -> bool:
+    async def send_escpos_to_hardware_async(self, commands: bytes) -> bool:
+        """Send raw ESC/POS commands without blocking the event loop.
+
+        The blocking interface call runs in a worker thread, so callers
+        can build the next receipt (or gather sends across printers)
+        while this one is still transmitting.
+
+        Args:
+            commands: ESC/POS command sequence
+
+        Returns:
+            True if commands were sent successfully, False otherwise
+        """
+        selected_printer = self._selected_printer
+        if selected_printer is None:
+            print("Error: No printer selected. Use select_printer() first.")
+            return False
+
+        return await _to_thread(
+            self.printer_interface.send_escpos_commands,
+            selected_printer.name, commands)
+
+    @_require_printer
+    def print_hardware_banner(self, selected_printer: PrinterInfo, text: str,
+                              char: str = '=', width: int = 32) -> bool:
         """Print a banner to the selected hardware printer using ESC/POS.
         
         Args:
@@ -200,28 +362,21 @@ class TextPrinter:
         Returns:
             True if printing was successful, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        # Build ESC/POS commands for banner
-        commands = (self.escpos
-                   .clear()
-                   .init_printer()
-                   .align_center()
-                   .bold(True)
-                   .line(char * width)
-                   .line(text)
-                   .line(char * width)
-                   .bold(False)
-                   .align_left()
-                   .feed_lines(2)
-                   .get_commands())
+        # Only the banner body varies; splice it between the frozen
+        # prologue and epilogue
+        border = _border_bytes(char, width)
+        commands = b''.join((
+            _BANNER_PREFIX,
+            border,
+            text.encode('cp437', errors='replace'), b'\n',
+            border,
+            _BANNER_SUFFIX))
         
-        return self.send_escpos_to_hardware(commands)
+        return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
-    def print_hardware_barcode(self, data: str, barcode_type: BarcodeType = BarcodeType.CODE128,
+    @_require_printer
+    def print_hardware_barcode(self, selected_printer: PrinterInfo, data: str,
+                              barcode_type: BarcodeType = BarcodeType.CODE128,
                               height: int = 100, width: int = 3) -> bool:
         """Print a barcode to the selected hardware printer.
         
@@ -234,23 +389,20 @@ class TextPrinter:
         Returns:
             True if printing was successful, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        commands = (self.escpos
-                   .clear()
-                   .init_printer()
-                   .align_center()
+        # Build into a fresh local builder: handlers can run concurrently
+        # in worker threads, and chaining on the shared self.escpos would
+        # interleave two jobs' command streams
+        commands = (ESCPOSCommandBuilder()
+                   .raw_command(_CENTERED_PREFIX)
                    .barcode(data, barcode_type, height, width)
-                   .align_left()
-                   .feed_lines(3)
+                   .raw_command(_CENTERED_SUFFIX)
                    .get_commands())
         
-        return self.send_escpos_to_hardware(commands)
+        return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
-    def print_hardware_qr_code(self, data: str, size: int = 4, error_correction: int = 1) -> bool:
+    @_require_printer
+    def print_hardware_qr_code(self, selected_printer: PrinterInfo, data: str,
+                               size: int = 4, error_correction: int = 1) -> bool:
         """Print a QR code to the selected hardware printer.
         
         Args:
@@ -261,23 +413,18 @@ class TextPrinter:
         Returns:
             True if printing was successful, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        commands = (self.escpos
-                   .clear()
-                   .init_printer()
-                   .align_center()
+        # Fresh local builder, see print_hardware_barcode
+        commands = (ESCPOSCommandBuilder()
+                   .raw_command(_CENTERED_PREFIX)
                    .qr_code(data, size, error_correction)
-                   .align_left()
-                   .feed_lines(3)
+                   .raw_command(_CENTERED_SUFFIX)
                    .get_commands())
         
-        return self.send_escpos_to_hardware(commands)
+        return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
-    def print_hardware_receipt(self, lines: List[str], cut_paper: bool = True) -> bool:
+    @_require_printer
+    def print_hardware_receipt(self, selected_printer: PrinterInfo,
+                               lines: List[str], cut_paper: bool = True) -> bool:
         """Print a formatted receipt to the selected hardware printer.
         
         Args:
@@ -287,26 +434,24 @@ class TextPrinter:
         Returns:
             True if printing was successful, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        # Build receipt commands
-        cmd_builder = self.escpos.clear().init_printer()
-        
-        for line in lines:
-            cmd_builder.line(line)
-        
+        # Encode the whole body up front and feed it as one raw block
+        # instead of a builder call per line; fresh local builder, see
+        # print_hardware_barcode
+        cmd_builder = ESCPOSCommandBuilder().init_printer()
+        if lines:
+            payload, _ = self._cp437_encode("\n".join(lines) + "\n", 'replace')
+            cmd_builder.raw_command(payload)
         cmd_builder.feed_lines(3)
-        
+
         if cut_paper:
             cmd_builder.paper_cut()
-        
+
         commands = cmd_builder.get_commands()
-        return self.send_escpos_to_hardware(commands)
+        return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
-    def open_cash_drawer(self, drawer_number: int = 1) -> bool:
+    @_require_printer
+    def open_cash_drawer(self, selected_printer: PrinterInfo,
+                         drawer_number: int = 1) -> bool:
         """Open the cash drawer connected to the selected printer.
         
         Args:
@@ -315,18 +460,41 @@ class TextPrinter:
         Returns:
             True if command was sent successfully, False otherwise
         """
-        selected_printer = self.get_selected_printer()
-        if not selected_printer:
-            print("Error: No printer selected. Use select_printer() first.")
-            return False
-        
-        commands = (self.escpos
-                   .clear()
+        # Fresh local builder, see print_hardware_barcode
+        commands = (ESCPOSCommandBuilder()
                    .open_drawer(drawer_number)
                    .get_commands())
         
-        return self.send_escpos_to_hardware(commands)
+        return self.printer_interface.send_escpos_commands(selected_printer.name, commands)
     
+    @contextmanager
+    def escpos_session(self):
+        """Batch several ESC/POS builder calls into one hardware send.
+
+        Yields the shared command builder; everything chained onto it
+        inside the block goes to the selected printer as a single
+        command sequence on exit, so one send covers the whole job
+        instead of one per operation. Nothing is sent if the block
+        raises, matching open_job.
+
+        Raises:
+            RuntimeError: If no printer is selected
+
+        Example:
+            with printer.escpos_session() as esc:
+                esc.init_printer().bold(True).line("TOTAL").bold(False)
+        """
+        selected_printer = self.get_selected_printer()
+        if not selected_printer:
+            raise RuntimeError("No printer selected. Use select_printer() first.")
+
+        builder = self.escpos.clear()
+        yield builder
+        commands = builder.get_commands()
+        if commands:
+            self.printer_interface.send_escpos_commands(
+                selected_printer.name, commands)
+
     def print_test_page(self, use_hardware: bool = False) -> bool:
         """Print a test page.
         
@@ -344,10 +512,8 @@ class TextPrinter:
             
             return self.printer_interface.print_test_page(selected_printer.name)
         else:
-            # Print to console
-            self.print_banner("PyTextPrinter Test Page")
-            print("This is a test page to verify functionality.", file=self.output)
-            print(f"Console output is working correctly.", file=self.output)
+            # Print to console in one write of the pre-rendered page
+            self.output.write(_TEST_PAGE)
             return True
     
     def get_printer_status(self, printer_name: Optional[str] = None) -> Optional[str]:
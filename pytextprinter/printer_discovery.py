@@ -1,14 +1,67 @@
 """Printer discovery module for finding connected text/thermal printers across platforms."""
 
+import csv
+import io
 import platform
 import subprocess
 import re
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+import sys
+import time
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
 
-@dataclass
+try:
+    import win32print
+except ImportError:
+    win32print = None
+
+try:
+    import cups
+except ImportError:
+    cups = None
+
+# How long per-printer details populated by a full enumeration stay valid
+# before get_printer_details falls back to a targeted query
+_DETAILS_TTL = 5.0
+
+# Suppress the console window flash when spawning wmic on Windows;
+# the flag does not exist on other platforms
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# lpstat output patterns, compiled once instead of per line
+_LPSTAT_PRINTER_RE = re.compile(r'printer (\S+) (.+)')
+# wmic /format:list emits Key=Value lines; one match extracts both parts
+_WMIC_KV_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$')
+_DEFAULT_DEST_RE = re.compile(r'(?:system )?default destination:\s*(\S+)')
+
+# Keywords identifying text/thermal printers. Compiled into single
+# alternation patterns so each candidate string is scanned once instead
+# of once per keyword
+_TEXT_PRINTER_KEYWORDS = (
+    'thermal', 'receipt', 'pos', 'text', 'dot matrix',
+    'impact', 'epson', 'star', 'citizen', 'zebra',
+    'bixolon', 'rongta', 'xprinter', 'escpos'
+)
+_TEXT_PRINTER_KW_RE = re.compile('|'.join(map(re.escape, _TEXT_PRINTER_KEYWORDS)))
+
+# Port types common for thermal printers (USB/COM/serial connections)
+_TEXT_PRINTER_PORT_RE = re.compile('usb|com|serial')
+
+
+# slots=True drops the per-instance __dict__ (less memory per printer,
+# faster attribute reads in the filter loop) but only exists on 3.10+;
+# manual __slots__ would clash with the dataclass field defaults
+_slots_kwargs = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_slots_kwargs)
 class PrinterInfo:
     """Information about a discovered printer."""
     name: str
@@ -20,7 +73,10 @@ class PrinterInfo:
     location: str = ""
     comment: str = ""
     platform_specific: Dict[str, Any] = None
-    
+    # Lazily memoized lowercase "name driver comment" composite used by
+    # filter_text_printers, so repeated filter passes skip the rebuild
+    _search_key: str = field(default='', init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.platform_specific is None:
             self.platform_specific = {}
@@ -59,63 +115,206 @@ class PrinterDiscoveryBase(ABC):
         Returns:
             Filtered list containing only text/thermal printers
         """
-        text_printer_keywords = [
-            'thermal', 'receipt', 'pos', 'text', 'dot matrix',
-            'impact', 'epson', 'star', 'citizen', 'zebra',
-            'bixolon', 'rongta', 'xprinter', 'escpos'
-        ]
-        
         filtered = []
         for printer in printers:
-            printer_info_lower = (printer.name + " " + printer.driver + " " + 
-                                printer.comment).lower()
-            
-            if any(keyword in printer_info_lower for keyword in text_printer_keywords):
+            printer_info_lower = printer._search_key
+            if not printer_info_lower:
+                printer_info_lower = (printer.name + " " + printer.driver + " " +
+                                    printer.comment).lower()
+                printer._search_key = printer_info_lower
+
+            if _TEXT_PRINTER_KW_RE.search(printer_info_lower):
                 filtered.append(printer)
             # Also include printers connected via USB or Serial (common for thermal printers)
-            elif any(port_type in printer.port.lower() for port_type in ['usb', 'com', 'serial']):
+            elif _TEXT_PRINTER_PORT_RE.search(printer.port.lower()):
                 filtered.append(printer)
-                
+
         return filtered
 
 
 class WindowsPrinterDiscovery(PrinterDiscoveryBase):
     """Windows-specific printer discovery using WMI and system commands."""
-    
+
+    # Lazily created SWbemServices connection, shared across instances so
+    # repeated discover_printers() calls reuse one WMI session instead of
+    # paying connection setup each time
+    _wmi_service = None
+
+    # wbemFlagReturnImmediately | wbemFlagForwardOnly: stream results
+    # without buffering the full rowset on the WMI side
+    _WBEM_FLAGS = 0x10 | 0x20
+
+    def __init__(self):
+        """Initialize with an empty per-name details cache."""
+        self._cache: Dict[str, PrinterInfo] = {}
+        self._cache_ts = 0.0
+
+    @classmethod
+    def _get_wmi_service(cls):
+        """Return the cached SWbemServices connection, creating it on first use."""
+        if cls._wmi_service is None:
+            cls._wmi_service = win32com.client.GetObject(
+                r'winmgmts:\\.\root\cimv2')
+        return cls._wmi_service
+
     def discover_printers(self) -> List[PrinterInfo]:
-        """Discover printers using Windows WMI and wmic commands."""
+        """Discover printers using the spooler API, WMI, or wmic commands."""
+        # Fastest path first: EnumPrinters reads the local spooler with no
+        # WMI marshaling at all, then one in-process COM query, then the
+        # legacy wmic shell-out when pywin32 is missing entirely
+        printers = None
+        if win32print is not None:
+            try:
+                printers = self._discover_printers_winspool()
+            except Exception:
+                pass
+        if printers is None and win32com is not None:
+            try:
+                printers = self._discover_printers_wmi()
+            except Exception:
+                pass
+        if printers is None:
+            printers = self._discover_printers_wmic()
+
+        # Remember every printer so get_printer_details can answer from
+        # memory instead of re-querying WMI once per lookup
+        self._cache = {p.name: p for p in printers}
+        self._cache_ts = time.monotonic()
+        return printers
+
+    # PRINTER_STATUS_* bits reported by the spooler in PRINTER_INFO_2
+    _SPOOLER_STATUS_FLAGS = (
+        (0x1, 'Paused'),
+        (0x2, 'Error'),
+        (0x8, 'Paper Jam'),
+        (0x10, 'Paper Out'),
+        (0x80, 'Offline'),
+        (0x200, 'Busy'),
+        (0x400, 'Printing'),
+    )
+
+    def _parse_spooler_status(self, status: int) -> str:
+        """Translate PRINTER_STATUS_* bit flags to a readable string."""
+        if not status:
+            return 'No Error'
+        labels = [label for flag, label in self._SPOOLER_STATUS_FLAGS
+                  if status & flag]
+        return ', '.join(labels) if labels else 'Unknown'
+
+    def _discover_printers_winspool(self) -> List[PrinterInfo]:
+        """Enumerate printers directly from the print spooler."""
+        flags = (win32print.PRINTER_ENUM_LOCAL
+                 | win32print.PRINTER_ENUM_CONNECTIONS)
+        try:
+            default_name = win32print.GetDefaultPrinter()
+        except Exception:
+            default_name = ""
+
         printers = []
-        
+        # Info level 2 carries driver, port, status, location and comment
+        # for every printer in a single native call
+        for info in win32print.EnumPrinters(flags, None, 2):
+            name = info.get('pPrinterName') or "Unknown"
+            printers.append(PrinterInfo(
+                name=name,
+                driver=info.get('pDriverName') or "Unknown",
+                port=info.get('pPortName') or "Unknown",
+                status=self._parse_spooler_status(info.get('Status', 0)),
+                is_default=name == default_name,
+                is_shared=bool(info.get('Attributes', 0) & 0x8),  # SHARED
+                location=info.get('pLocation') or "",
+                comment=info.get('pComment') or "",
+                platform_specific={'winspool': info}
+            ))
+
+        return printers
+
+    def _printer_info_from_com(self, item) -> PrinterInfo:
+        """Build a PrinterInfo from a Win32_Printer COM object."""
+        return PrinterInfo(
+            name=item.Name or "Unknown",
+            driver=item.DriverName or "Unknown",
+            port=item.PortName or "Unknown",
+            status=self._parse_status(item.PrinterStatus),
+            is_default=bool(item.Default),
+            is_shared=bool(item.Shared),
+            location=item.Location or "",
+            comment=item.Comment or "",
+            platform_specific={'wmi_source': 'win32com'}
+        )
+
+    def _discover_printers_wmi(self) -> List[PrinterInfo]:
+        """Enumerate printers via a native WMI query."""
+        service = self._get_wmi_service()
+        results = service.ExecQuery(
+            'SELECT Name,DriverName,PortName,PrinterStatus,Default,Shared,'
+            'Location,Comment FROM Win32_Printer',
+            'WQL', self._WBEM_FLAGS)
+        return [self._printer_info_from_com(item) for item in results]
+
+    def _discover_printers_wmic(self) -> List[PrinterInfo]:
+        """Enumerate printers by shelling out to the legacy wmic binary."""
+        printers = []
+
         try:
             # Use wmic to get printer information
             result = subprocess.run([
                 'wmic', 'printer', 'get', 
                 'Name,DriverName,PortName,PrinterStatus,Default,Shared,Location,Comment',
                 '/format:csv'
-            ], capture_output=True, text=True, shell=True)
+            ], capture_output=True, text=True,
+                creationflags=_CREATE_NO_WINDOW)
             
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 7:
-                            printers.append(PrinterInfo(
-                                name=parts[5] or "Unknown",
-                                driver=parts[2] or "Unknown",
-                                port=parts[6] or "Unknown",
-                                status=self._parse_status(parts[7]),
-                                is_default=parts[1].lower() == 'true' if parts[1] else False,
-                                is_shared=parts[8].lower() == 'true' if len(parts) > 8 and parts[8] else False,
-                                location=parts[4] if len(parts) > 4 else "",
-                                comment=parts[0] if parts[0] else "",
-                                platform_specific={'wmi_data': line}
-                            ))
+                # csv.reader handles quoted fields, so a comma inside a
+                # printer Name/Location/Comment no longer shifts columns;
+                # mapping columns by header name also stops relying on
+                # wmic's field ordering (Node comes first, not Name)
+                reader = csv.reader(io.StringIO(result.stdout))
+                cols = None
+                for row in reader:
+                    if not row or not any(cell.strip() for cell in row):
+                        continue
+                    if cols is None:
+                        # Resolve every column index once per header; the
+                        # data rows below then use plain integer indexing
+                        # with no per-row dict construction
+                        idx = {name.strip(): i for i, name in enumerate(row)}
+                        try:
+                            cols = tuple(idx[c] for c in (
+                                'Name', 'DriverName', 'PortName',
+                                'PrinterStatus', 'Default', 'Shared',
+                                'Location', 'Comment'))
+                        except KeyError:
+                            break  # unexpected header, nothing parseable
+                        (i_name, i_driver, i_port, i_status,
+                         i_default, i_shared, i_location, i_comment) = cols
+                        max_idx = max(cols)
+                        continue
+                    if len(row) <= max_idx:
+                        continue
+
+                    name = row[i_name].strip()
+                    if not name:
+                        continue
+
+                    printers.append(PrinterInfo(
+                        name=name,
+                        driver=row[i_driver].strip() or "Unknown",
+                        port=row[i_port].strip() or "Unknown",
+                        status=self._parse_status(row[i_status].strip() or '0'),
+                        is_default=row[i_default].strip().lower() == 'true',
+                        is_shared=row[i_shared].strip().lower() == 'true',
+                        location=row[i_location].strip(),
+                        comment=row[i_comment].strip(),
+                        platform_specific={'wmi_data': row}
+                    ))
         except Exception as e:
             # Fallback to simpler method
             try:
                 result = subprocess.run(['wmic', 'printer', 'get', 'Name'], 
-                                      capture_output=True, text=True, shell=True)
+                                      capture_output=True, text=True,
+                creationflags=_CREATE_NO_WINDOW)
                 if result.returncode == 0:
                     for line in result.stdout.strip().split('\n')[1:]:
                         if line.strip():
@@ -132,17 +331,33 @@ class WindowsPrinterDiscovery(PrinterDiscoveryBase):
     
     def get_printer_details(self, printer_name: str) -> Optional[PrinterInfo]:
         """Get detailed information about a specific Windows printer."""
+        # Serve from the enumeration cache while it is fresh; a recent
+        # discover_printers already fetched every field we need
+        if (printer_name in self._cache
+                and time.monotonic() - self._cache_ts < _DETAILS_TTL):
+            return self._cache[printer_name]
+
+        if win32com is not None:
+            try:
+                # Direct object bind: cheaper than a WQL query with WHERE
+                item = self._get_wmi_service().Get(
+                    f"Win32_Printer.Name='{printer_name}'")
+                return self._printer_info_from_com(item)
+            except Exception:
+                pass
+
         try:
             result = subprocess.run([
                 'wmic', 'printer', 'where', f'Name="{printer_name}"', 'get', '*', '/format:list'
-            ], capture_output=True, text=True, shell=True)
+            ], capture_output=True, text=True,
+                creationflags=_CREATE_NO_WINDOW)
             
             if result.returncode == 0:
                 details = {}
                 for line in result.stdout.split('\n'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        details[key.strip()] = value.strip()
+                    match = _WMIC_KV_RE.match(line)
+                    if match:
+                        details[match.group(1)] = match.group(2).strip()
                 
                 return PrinterInfo(
                     name=details.get('Name', printer_name),
@@ -160,66 +375,163 @@ class WindowsPrinterDiscovery(PrinterDiscoveryBase):
         
         return None
     
+    def get_printer_details_bulk(self, printer_names: List[str]) -> Dict[str, PrinterInfo]:
+        """Get details for several printers with a single WMI round-trip.
+
+        Args:
+            printer_names: Names of the printers to query
+
+        Returns:
+            Mapping of printer name to PrinterInfo for every printer found
+        """
+        if not printer_names:
+            return {}
+
+        if win32com is not None:
+            try:
+                # One compound query instead of one RPC per name; WQL
+                # string literals escape embedded single quotes by doubling
+                predicate = ' OR '.join(
+                    "Name='{}'".format(name.replace("'", "''"))
+                    for name in printer_names)
+                results = self._get_wmi_service().ExecQuery(
+                    'SELECT * FROM Win32_Printer WHERE ' + predicate,
+                    'WQL', self._WBEM_FLAGS)
+                return {info.name: info for info in
+                        map(self._printer_info_from_com, results)}
+            except Exception:
+                pass
+
+        # Fallback: per-name lookups, which still hit the enumeration
+        # cache when it is fresh
+        details = {}
+        for name in printer_names:
+            info = self.get_printer_details(name)
+            if info is not None:
+                details[name] = info
+        return details
+
+    # Win32_Printer.PrinterStatus codes, hoisted so _parse_status does not
+    # rebuild the dict on every call inside the enumeration loop
+    _STATUS_MAP = {
+        '0': 'Unknown',
+        '1': 'Other',
+        '2': 'No Error',
+        '3': 'Degraded',
+        '4': 'Predicted Failure',
+        '5': 'Error',
+        '6': 'Non-Recoverable Error',
+        '7': 'Starting',
+        '8': 'Stopping',
+        '9': 'Stopped',
+        '10': 'In Service',
+        '11': 'No Contact',
+        '12': 'Lost Communication'
+    }
+
     def _parse_status(self, status_code: str) -> str:
         """Parse Windows printer status code to human-readable string."""
-        status_map = {
-            '0': 'Unknown',
-            '1': 'Other',
-            '2': 'No Error',
-            '3': 'Degraded',
-            '4': 'Predicted Failure',
-            '5': 'Error',
-            '6': 'Non-Recoverable Error',
-            '7': 'Starting',
-            '8': 'Stopping',
-            '9': 'Stopped',
-            '10': 'In Service',
-            '11': 'No Contact',
-            '12': 'Lost Communication'
-        }
-        return status_map.get(str(status_code), 'Unknown')
+        # str() keeps WMI COM integers and wmic strings on one code path
+        return self._STATUS_MAP.get(str(status_code), 'Unknown')
 
 
 class LinuxPrinterDiscovery(PrinterDiscoveryBase):
     """Linux-specific printer discovery using CUPS and lpstat."""
-    
+
+    def __init__(self):
+        """Initialize with an empty per-name details cache."""
+        self._details_cache: Dict[str, Any] = {}
+        self._cups_conn = None
+
+    def _get_cups_connection(self):
+        """Return a lazily created pycups connection, reused across calls."""
+        if self._cups_conn is None:
+            self._cups_conn = cups.Connection()
+        return self._cups_conn
+
     def discover_printers(self) -> List[PrinterInfo]:
-        """Discover printers using CUPS lpstat command."""
+        """Discover printers using CUPS, preferring the native IPP binding."""
+        # One getPrinters() call over the local IPP socket returns every
+        # queue with attributes — no fork/exec per printer and no text
+        # parsing. Falls back to lpstat when pycups is unavailable
+        if cups is not None:
+            try:
+                return self._discover_printers_cups()
+            except Exception:
+                pass
+        return self._discover_printers_lpstat()
+
+    def _discover_printers_cups(self) -> List[PrinterInfo]:
+        """Enumerate printers via the native pycups IPP binding."""
         printers = []
-        
+        conn = self._get_cups_connection()
+        default_printer = conn.getDefault() or ""
+
+        for name, attrs in conn.getPrinters().items():
+            printers.append(PrinterInfo(
+                name=name,
+                driver=attrs.get('printer-make-and-model', 'Unknown'),
+                port=attrs.get('device-uri', 'Unknown'),
+                status=attrs.get('printer-state-message') or 'Unknown',
+                is_default=name == default_printer,
+                location=attrs.get('printer-location', ''),
+                comment=attrs.get('printer-info', ''),
+                platform_specific=attrs
+            ))
+
+        return printers
+
+    def _discover_printers_lpstat(self) -> List[PrinterInfo]:
+        """Enumerate printers by shelling out to lpstat/lpoptions."""
+        printers = []
+
         try:
-            # Get printer list with details
-            result = subprocess.run(['lpstat', '-p', '-d'], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                default_printer = ""
-                # Parse default printer
-                for line in result.stdout.split('\n'):
-                    if line.startswith('system default destination:'):
-                        default_printer = line.split(':')[-1].strip()
-                        break
-                
-                # Parse printer information
-                for line in result.stdout.split('\n'):
-                    if line.startswith('printer '):
-                        match = re.match(r'printer (\S+) (.+)', line)
-                        if match:
-                            name = match.group(1)
-                            status = match.group(2)
-                            
-                            # Get additional details
-                            details = self._get_cups_printer_details(name)
-                            
-                            printers.append(PrinterInfo(
-                                name=name,
-                                driver=details.get('driver', 'Unknown'),
-                                port=details.get('device-uri', 'Unknown'),
-                                status=status,
-                                is_default=name == default_printer,
-                                location=details.get('printer-location', ''),
-                                comment=details.get('printer-info', ''),
-                                platform_specific=details
-                            ))
+            # Stream the output line by line: parsing overlaps with the
+            # subprocess and no full stdout copy gets buffered. A single
+            # pass picks up both the default destination and the printer
+            # lines
+            proc = subprocess.Popen(['lpstat', '-p', '-d'],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL,
+                                    text=True, bufsize=1)
+            default_printer = ""
+            entries = []
+            try:
+                for line in proc.stdout:
+                    match = _DEFAULT_DEST_RE.match(line)
+                    if match:
+                        default_printer = match.group(1)
+                        continue
+                    match = _LPSTAT_PRINTER_RE.match(line)
+                    if match:
+                        entries.append((match.group(1), match.group(2)))
+            finally:
+                proc.stdout.close()
+
+            if proc.wait() == 0:
+                # Fetch per-printer details concurrently: each lpoptions
+                # call blocks on fork/exec plus a CUPS round-trip, so the
+                # total latency collapses to the slowest call instead of
+                # the sum
+                details_list = []
+                if entries:
+                    names = [name for name, _ in entries]
+                    with ThreadPoolExecutor(
+                            max_workers=min(8, len(names))) as executor:
+                        details_list = list(executor.map(
+                            self._get_cups_printer_details, names))
+
+                for (name, status), details in zip(entries, details_list):
+                    printers.append(PrinterInfo(
+                        name=name,
+                        driver=details.get('driver', 'Unknown'),
+                        port=details.get('device-uri', 'Unknown'),
+                        status=status,
+                        is_default=name == default_printer,
+                        location=details.get('printer-location', ''),
+                        comment=details.get('printer-info', ''),
+                        platform_specific=details
+                    ))
         except Exception:
             # Fallback to simple lpstat
             try:
@@ -256,6 +568,13 @@ class LinuxPrinterDiscovery(PrinterDiscoveryBase):
     
     def _get_cups_printer_details(self, printer_name: str) -> Dict[str, str]:
         """Get detailed printer information from CUPS."""
+        # One lpoptions spawn per printer adds up fast inside the discovery
+        # loop; reuse fresh results keyed by printer name
+        cached = self._details_cache.get(printer_name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _DETAILS_TTL:
+            return cached[1]
+
         details = {}
         try:
             result = subprocess.run(['lpoptions', '-p', printer_name, '-l'], 
@@ -267,7 +586,8 @@ class LinuxPrinterDiscovery(PrinterDiscoveryBase):
                         details[key.strip()] = value.strip()
         except Exception:
             pass
-        
+
+        self._details_cache[printer_name] = (now, details)
         return details
 
 
@@ -283,45 +603,54 @@ class MacOSPrinterDiscovery(PrinterDiscoveryBase):
             result = subprocess.run(['lpstat', '-p', '-d'], capture_output=True, text=True)
             
             if result.returncode == 0:
+                # Single pass, mirroring the Linux parser
                 default_printer = ""
+                entries = []
                 for line in result.stdout.split('\n'):
-                    if 'default destination:' in line:
-                        default_printer = line.split(':')[-1].strip()
-                        break
-                
-                for line in result.stdout.split('\n'):
-                    if line.startswith('printer '):
-                        match = re.match(r'printer (\S+) (.+)', line)
-                        if match:
-                            name = match.group(1)
-                            status = match.group(2)
-                            
-                            printers.append(PrinterInfo(
-                                name=name,
-                                driver="Unknown",
-                                port="Unknown",
-                                status=status,
-                                is_default=name == default_printer
-                            ))
+                    match = _DEFAULT_DEST_RE.match(line)
+                    if match:
+                        default_printer = match.group(1)
+                        continue
+                    match = _LPSTAT_PRINTER_RE.match(line)
+                    if match:
+                        entries.append((match.group(1), match.group(2)))
+
+                for name, status in entries:
+                    printers.append(PrinterInfo(
+                        name=name,
+                        driver="Unknown",
+                        port="Unknown",
+                        status=status,
+                        is_default=name == default_printer
+                    ))
             
-            # Get additional details using system_profiler
+            # Index printers by name once so system_profiler lines resolve
+            # in O(1) instead of a linear scan per Location line
+            by_name = {p.name: p for p in printers}
+
+            # Get additional details using system_profiler, streaming its
+            # (verbose) output instead of buffering it whole
             try:
-                result = subprocess.run(['system_profiler', 'SPPrintersDataType'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
+                proc = subprocess.Popen(['system_profiler', 'SPPrintersDataType'],
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL,
+                                        text=True, bufsize=1)
+                try:
                     # Parse system_profiler output to enhance printer information
                     current_printer = None
-                    for line in result.stdout.split('\n'):
+                    for line in proc.stdout:
                         line = line.strip()
                         if line.endswith(':') and not line.startswith(' '):
                             current_printer = line[:-1]
                         elif current_printer and line.startswith('Location:'):
                             location = line.replace('Location:', '').strip()
-                            # Find and update the corresponding printer
-                            for printer in printers:
-                                if printer.name == current_printer:
-                                    printer.location = location
-                                    break
+                            # Update the corresponding printer, if known
+                            printer = by_name.get(current_printer)
+                            if printer:
+                                printer.location = location
+                finally:
+                    proc.stdout.close()
+                    proc.wait()
             except Exception:
                 pass
                 
@@ -350,38 +679,63 @@ class MacOSPrinterDiscovery(PrinterDiscoveryBase):
         return None
 
 
+# Static platform dispatch table; platform.system() itself is cheap after
+# the first call because the platform module caches uname results
+_DISCOVERY_CLASSES = {
+    'windows': WindowsPrinterDiscovery,
+    'linux': LinuxPrinterDiscovery,
+    'darwin': MacOSPrinterDiscovery,  # macOS
+}
+
+
 class PrinterDiscovery:
     """Main printer discovery class that handles all platforms."""
-    
+
     def __init__(self):
         """Initialize with platform-specific discovery implementation."""
         system = platform.system().lower()
-        
-        if system == 'windows':
-            self._discovery = WindowsPrinterDiscovery()
-        elif system == 'linux':
-            self._discovery = LinuxPrinterDiscovery()
-        elif system == 'darwin':  # macOS
-            self._discovery = MacOSPrinterDiscovery()
-        else:
+        discovery_cls = _DISCOVERY_CLASSES.get(system)
+        if discovery_cls is None:
             raise NotImplementedError(f"Platform {system} is not supported")
-    
-    def discover_all_printers(self) -> List[PrinterInfo]:
+        self._discovery = discovery_cls()
+
+        # Discovery shells out to OS tools, so cache results briefly:
+        # refresh buttons and status polls tend to call these repeatedly
+        self._cache: Optional[Tuple[float, List[PrinterInfo]]] = None
+        self._ttl = 2.0
+
+    def discover_all_printers(self, force: bool = False) -> List[PrinterInfo]:
         """Discover all available printers on the current platform.
-        
+
+        Results are cached for a short interval so repeated calls do not
+        re-spawn the underlying OS discovery commands.
+
+        Args:
+            force: Bypass the cache and re-enumerate immediately
+
         Returns:
             List of all discovered printers
         """
-        return self._discovery.discover_printers()
-    
+        if (not force and self._cache is not None
+                and time.monotonic() - self._cache[0] < self._ttl):
+            return self._cache[1]
+
+        printers = self._discovery.discover_printers()
+        self._cache = (time.monotonic(), printers)
+        return printers
+
     def discover_text_printers(self) -> List[PrinterInfo]:
         """Discover only text/thermal printers.
-        
+
         Returns:
             Filtered list of text/thermal printers
         """
         all_printers = self.discover_all_printers()
         return self._discovery.filter_text_printers(all_printers)
+
+    def invalidate(self) -> None:
+        """Drop cached discovery results so the next call re-enumerates."""
+        self._cache = None
     
     def get_printer_info(self, printer_name: str) -> Optional[PrinterInfo]:
         """Get detailed information about a specific printer.
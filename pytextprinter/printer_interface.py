@@ -1,13 +1,59 @@
 """Platform-specific printer interfaces for sending raw data to printers."""
 
+import asyncio
+import atexit
 import platform
 import subprocess
-import tempfile
-import os
-from typing import Optional, Union, Dict, Any
+import threading
+from typing import Iterable, List, Optional, Tuple, Union, Dict, Any
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from .printer_discovery import PrinterInfo
 
+try:
+    import cups
+except ImportError:
+    cups = None
+
+
+def _to_thread(func, *args, **kwargs):
+    """Run a blocking call in the default executor.
+
+    asyncio.to_thread only exists on 3.9+ and we still support 3.7;
+    run_in_executor is the equivalent spelling for older runtimes.
+
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for the call
+        **kwargs: Keyword arguments for the call
+
+    Returns:
+        Awaitable resolving to the call's return value
+    """
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+@lru_cache(maxsize=256)
+def _encode(text: str, encoding: str) -> bytes:
+    """Encode printer text, caching results for repeated payloads.
+
+    Templates like headers, separators and feed sequences get printed
+    over and over; cache hits skip the encode pass entirely.
+
+    Args:
+        text: Text to encode
+        encoding: Character encoding to use
+
+    Returns:
+        Encoded bytes, falling back to UTF-8 with replacement on errors
+    """
+    try:
+        return text.encode(encoding)
+    except UnicodeEncodeError:
+        return text.encode('utf-8', errors='replace')
+
 
 class PrinterInterfaceBase(ABC):
     """Abstract base class for platform-specific printer interfaces."""
@@ -42,15 +88,114 @@ class PrinterInterfaceBase(ABC):
     @abstractmethod
     def is_printer_ready(self, printer_name: str) -> bool:
         """Check if the printer is ready to receive data.
-        
+
         Args:
             printer_name: Name of the printer
-            
+
         Returns:
             True if printer is ready, False otherwise
         """
         pass
 
+    def send_text_batch(self, printer_name: str, lines: Iterable[str],
+                        encoding: str = 'cp437') -> bool:
+        """Send several text fragments as a single print job.
+
+        Collapses N per-line jobs (one StartDoc..EndDoc sequence on
+        Windows, one lp spawn on Linux/macOS) into one.
+
+        Args:
+            printer_name: Name of the printer
+            lines: Text fragments to concatenate and send
+            encoding: Character encoding to use
+
+        Returns:
+            True if the job was sent successfully, False otherwise
+        """
+        return self.send_raw_data(printer_name,
+                                  _encode(''.join(lines), encoding))
+
+    @contextmanager
+    def open_job(self, printer_name: str):
+        """Buffer raw writes and emit them as one print job on exit.
+
+        Yields a bytearray to append payload bytes to; the accumulated
+        buffer is sent with a single send_raw_data call when the block
+        completes. Nothing is sent if the block raises.
+
+        Args:
+            printer_name: Name of the printer
+
+        Yields:
+            Bytearray collecting the job payload
+        """
+        buf = bytearray()
+        yield buf
+        if buf:
+            self.send_raw_data(printer_name, bytes(buf))
+
+    def send_escpos_commands(self, printer_name: str, commands: bytes) -> bool:
+        """Send ESC/POS commands to the specified printer.
+
+        Args:
+            printer_name: Name of the printer
+            commands: ESC/POS command sequence
+
+        Returns:
+            True if commands were sent successfully, False otherwise
+        """
+        return self.send_raw_data(printer_name, commands)
+
+    async def send_raw_data_async(self, printer_name: str, data: bytes) -> bool:
+        """Send raw data without blocking the event loop.
+
+        The default implementation runs the blocking send in a worker
+        thread; platforms with a natively async transport override it.
+
+        Args:
+            printer_name: Name of the printer
+            data: Raw data to send
+
+        Returns:
+            True if data was sent successfully, False otherwise
+        """
+        return await _to_thread(self.send_raw_data, printer_name, data)
+
+    async def send_many_async(self, jobs: Iterable[Tuple[str, bytes]]) -> List[bool]:
+        """Send several print jobs concurrently.
+
+        Args:
+            jobs: (printer_name, data) pairs to send
+
+        Returns:
+            Per-job success flags, in input order
+        """
+        results = await asyncio.gather(
+            *(self.send_raw_data_async(name, data) for name, data in jobs))
+        return list(results)
+
+    def print_test_page(self, printer_name: str) -> bool:
+        """Print a test page to verify printer functionality.
+
+        Args:
+            printer_name: Name of the printer
+
+        Returns:
+            True if test page was sent successfully, False otherwise
+        """
+        test_content = (
+            "PyTextPrinter Test Page\n"
+            "======================\n\n"
+            "This is a test page to verify printer functionality.\n"
+            "If you can read this, the printer is working correctly.\n\n"
+            f"Printer: {printer_name}\n"
+            f"Platform: {platform.system()}\n\n"
+            "Test completed successfully.\n"
+            "\n\n\n"  # Feed some lines for cutting
+        )
+
+        return self.send_text(printer_name, test_content)
+
 
 class WindowsPrinterInterface(PrinterInterfaceBase):
     """Windows-specific printer interface using raw printing APIs."""
@@ -58,6 +203,12 @@ class WindowsPrinterInterface(PrinterInterfaceBase):
     def __init__(self):
         """Initialize Windows printer interface."""
         self._win32print = None
+        # Open printer handles cached per printer name; opening one is a
+        # kernel round-trip, so reuse it across jobs instead of paying it
+        # per call. The RLock both protects the dict and serializes the
+        # StartDoc..EndDoc sequence, which is not thread-safe per handle
+        self._handles: Dict[str, Any] = {}
+        self._handles_lock = threading.RLock()
         try:
             import win32print
             import win32api
@@ -66,91 +217,115 @@ class WindowsPrinterInterface(PrinterInterfaceBase):
         except ImportError:
             # Fallback to command-line methods
             pass
-    
+        if self._win32print:
+            atexit.register(self.close)
+
+    def _get_handle(self, printer_name: str):
+        """Return a cached open printer handle, opening it on first use."""
+        with self._handles_lock:
+            handle = self._handles.get(printer_name)
+            if handle is None:
+                handle = self._win32print.OpenPrinter(printer_name)
+                self._handles[printer_name] = handle
+            return handle
+
+    def _drop_handle(self, printer_name: str) -> None:
+        """Close and forget a cached handle (e.g. after a failed call)."""
+        with self._handles_lock:
+            handle = self._handles.pop(printer_name, None)
+        if handle is not None:
+            try:
+                self._win32print.ClosePrinter(handle)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Close all cached printer handles."""
+        with self._handles_lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        for handle in handles:
+            try:
+                self._win32print.ClosePrinter(handle)
+            except Exception:
+                pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def send_raw_data(self, printer_name: str, data: bytes) -> bool:
         """Send raw data to Windows printer."""
         if self._win32print:
             return self._send_raw_data_win32(printer_name, data)
         else:
             return self._send_raw_data_fallback(printer_name, data)
-    
+
     def _send_raw_data_win32(self, printer_name: str, data: bytes) -> bool:
         """Send raw data using win32print APIs."""
         try:
-            # Open printer
-            printer_handle = self._win32print.OpenPrinter(printer_name)
-            
-            # Start document
-            job_info = ("PyTextPrinter Raw Job", None, "RAW")
-            job_id = self._win32print.StartDocPrinter(printer_handle, 1, job_info)
-            
-            # Start page
-            self._win32print.StartPagePrinter(printer_handle)
-            
-            # Write data
-            self._win32print.WritePrinter(printer_handle, data)
-            
-            # End page and document
-            self._win32print.EndPagePrinter(printer_handle)
-            self._win32print.EndDocPrinter(printer_handle)
-            
-            # Close printer
-            self._win32print.ClosePrinter(printer_handle)
-            
+            with self._handles_lock:
+                printer_handle = self._get_handle(printer_name)
+
+                # Start document
+                job_info = ("PyTextPrinter Raw Job", None, "RAW")
+                job_id = self._win32print.StartDocPrinter(printer_handle, 1, job_info)
+
+                # Start page
+                self._win32print.StartPagePrinter(printer_handle)
+
+                # Write data
+                self._win32print.WritePrinter(printer_handle, data)
+
+                # End page and document; the handle stays open for the
+                # next job
+                self._win32print.EndPagePrinter(printer_handle)
+                self._win32print.EndDocPrinter(printer_handle)
+
             return True
-            
+
         except Exception as e:
+            # The cached handle may be stale (printer removed, spooler
+            # restarted); drop it so the next call reopens cleanly
+            self._drop_handle(printer_name)
             print(f"Error sending raw data to {printer_name}: {e}")
             return False
     
     def _send_raw_data_fallback(self, printer_name: str, data: bytes) -> bool:
-        """Send raw data using command-line fallback."""
+        """Send raw data by writing to the printer's UNC share directly."""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(data)
-                temp_filename = temp_file.name
-            
-            try:
-                # Use copy command to send to printer
-                result = subprocess.run([
-                    'copy', '/B', temp_filename, f'\\\\localhost\\{printer_name}'
-                ], shell=True, capture_output=True, text=True)
-                
-                return result.returncode == 0
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_filename)
-                
+            # Open the share as a plain unbuffered file: one write, no
+            # temp file and no cmd.exe 'copy /B' spawn. Requires the
+            # printer to be shared, same as the copy command it replaces
+            with open(fr'\\localhost\{printer_name}', 'wb', buffering=0) as printer_file:
+                printer_file.write(data)
+            return True
+
         except Exception as e:
             print(f"Error sending raw data to {printer_name}: {e}")
             return False
     
     def send_text(self, printer_name: str, text: str, encoding: str = 'cp437') -> bool:
         """Send text to Windows printer."""
-        try:
-            data = text.encode(encoding)
-            return self.send_raw_data(printer_name, data)
-        except UnicodeEncodeError:
-            # Fallback to UTF-8 with error replacement
-            data = text.encode('utf-8', errors='replace')
-            return self.send_raw_data(printer_name, data)
+        return self.send_raw_data(printer_name, _encode(text, encoding))
     
     def is_printer_ready(self, printer_name: str) -> bool:
         """Check if Windows printer is ready."""
         if self._win32print:
             try:
-                printer_handle = self._win32print.OpenPrinter(printer_name)
-                printer_info = self._win32print.GetPrinter(printer_handle, 2)
-                self._win32print.ClosePrinter(printer_handle)
-                
+                with self._handles_lock:
+                    printer_handle = self._get_handle(printer_name)
+                    printer_info = self._win32print.GetPrinter(printer_handle, 2)
+
                 # Check printer status
                 status = printer_info.get('Status', 0)
                 # Status 0 typically means ready
                 return status == 0
-                
+
             except Exception:
+                self._drop_handle(printer_name)
                 return False
         else:
             # Fallback: assume printer is ready if it exists
@@ -166,53 +341,98 @@ class WindowsPrinterInterface(PrinterInterfaceBase):
 
 class LinuxPrinterInterface(PrinterInterfaceBase):
     """Linux-specific printer interface using CUPS and lp commands."""
-    
+
+    def __init__(self):
+        """Initialize with a lazily created CUPS connection."""
+        self._cups_conn = None
+        # pycups connections are not thread-safe and a job submission is
+        # a multi-step sequence; serialize access like the Windows
+        # handle cache does
+        self._cups_lock = threading.Lock()
+
+    def _get_cups_connection(self):
+        """Return the persistent pycups connection, creating it on first use."""
+        if self._cups_conn is None:
+            self._cups_conn = cups.Connection()
+        return self._cups_conn
+
     def send_raw_data(self, printer_name: str, data: bytes) -> bool:
-        """Send raw data to Linux printer using lp command."""
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(data)
-                temp_filename = temp_file.name
-            
+        """Send raw data to Linux printer via CUPS or the lp command."""
+        # Preferred path: submit over one long-lived IPP connection, no
+        # lp fork/exec per job. Falls back to lp when pycups is missing
+        if cups is not None:
             try:
-                # Use lp command to send raw data
-                result = subprocess.run([
-                    'lp', '-d', printer_name, '-o', 'raw', temp_filename
-                ], capture_output=True, text=True)
-                
-                return result.returncode == 0
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_filename)
-                
+                return self._send_raw_data_cups(printer_name, data)
+            except Exception:
+                # The connection may have gone stale; rebuild next time
+                self._cups_conn = None
+        return self._send_raw_data_lp(printer_name, data)
+
+    def _send_raw_data_cups(self, printer_name: str, data: bytes) -> bool:
+        """Submit a raw job over the persistent IPP connection."""
+        # Hold the lock across the whole createJob..finishDocument
+        # sequence so concurrent sends cannot interleave documents on
+        # the shared connection
+        with self._cups_lock:
+            conn = self._get_cups_connection()
+            job_id = conn.createJob(printer_name, 'PyTextPrinter Raw Job',
+                                    {'raw': 'true'})
+            conn.startDocument(printer_name, job_id, 'data',
+                               'application/octet-stream', 1)
+            conn.writeRequestData(data, len(data))
+            conn.finishDocument(printer_name)
+        return True
+
+    def _send_raw_data_lp(self, printer_name: str, data: bytes) -> bool:
+        """Send raw data by piping it into the lp command."""
+        try:
+            # Pipe the payload straight into lp's stdin: no temp file on
+            # disk, no extra write/read round-trip, no cleanup path
+            result = subprocess.run([
+                'lp', '-d', printer_name, '-o', 'raw'
+            ], input=data, capture_output=True)
+
+            return result.returncode == 0
+
         except Exception as e:
             print(f"Error sending raw data to {printer_name}: {e}")
             return False
-    
+
     def send_text(self, printer_name: str, text: str, encoding: str = 'cp437') -> bool:
         """Send text to Linux printer."""
+        return self.send_raw_data(printer_name, _encode(text, encoding))
+
+    async def send_raw_data_async(self, printer_name: str, data: bytes) -> bool:
+        """Send raw data to Linux printer without blocking the event loop."""
         try:
-            # For text, we can send directly through lp
-            result = subprocess.run([
-                'lp', '-d', printer_name, '-o', 'raw'
-            ], input=text, text=True, capture_output=True, encoding=encoding)
-            
-            return result.returncode == 0
-            
+            # Natively async lp spawn: concurrent sends overlap their
+            # fork/exec and CUPS spool waits instead of serializing
+            proc = await asyncio.create_subprocess_exec(
+                'lp', '-d', printer_name, '-o', 'raw',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+            await proc.communicate(data)
+            return proc.returncode == 0
+
         except Exception as e:
-            print(f"Error sending text to {printer_name}: {e}")
-            # Fallback to raw data method
-            try:
-                data = text.encode(encoding)
-                return self.send_raw_data(printer_name, data)
-            except UnicodeEncodeError:
-                data = text.encode('utf-8', errors='replace')
-                return self.send_raw_data(printer_name, data)
+            print(f"Error sending raw data to {printer_name}: {e}")
+            return False
     
     def is_printer_ready(self, printer_name: str) -> bool:
-        """Check if Linux printer is ready using lpstat."""
+        """Check if Linux printer is ready using CUPS or lpstat."""
+        # Library call first: one IPP attribute fetch, no lpstat spawn.
+        # IPP printer-state is 3=idle, 4=processing, 5=stopped; idle and
+        # printing both count as ready, matching the lpstat heuristic
+        if cups is not None:
+            try:
+                with self._cups_lock:
+                    attrs = self._get_cups_connection().getPrinterAttributes(
+                        printer_name)
+                return attrs.get('printer-state', 5) != 5
+            except Exception:
+                self._cups_conn = None
+
         try:
             result = subprocess.run([
                 'lpstat', '-p', printer_name
@@ -230,53 +450,98 @@ class LinuxPrinterInterface(PrinterInterfaceBase):
 
 class MacOSPrinterInterface(PrinterInterfaceBase):
     """macOS-specific printer interface using CUPS and lp commands."""
-    
+
+    def __init__(self):
+        """Initialize with a lazily created CUPS connection."""
+        self._cups_conn = None
+        # pycups connections are not thread-safe and a job submission is
+        # a multi-step sequence; serialize access like the Windows
+        # handle cache does
+        self._cups_lock = threading.Lock()
+
+    def _get_cups_connection(self):
+        """Return the persistent pycups connection, creating it on first use."""
+        if self._cups_conn is None:
+            self._cups_conn = cups.Connection()
+        return self._cups_conn
+
     def send_raw_data(self, printer_name: str, data: bytes) -> bool:
-        """Send raw data to macOS printer using lp command."""
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(data)
-                temp_filename = temp_file.name
-            
+        """Send raw data to macOS printer via CUPS or the lp command."""
+        # Preferred path: submit over one long-lived IPP connection, no
+        # lp fork/exec per job. Falls back to lp when pycups is missing
+        if cups is not None:
             try:
-                # Use lp command to send raw data
-                result = subprocess.run([
-                    'lp', '-d', printer_name, '-o', 'raw', temp_filename
-                ], capture_output=True, text=True)
-                
-                return result.returncode == 0
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_filename)
-                
+                return self._send_raw_data_cups(printer_name, data)
+            except Exception:
+                # The connection may have gone stale; rebuild next time
+                self._cups_conn = None
+        return self._send_raw_data_lp(printer_name, data)
+
+    def _send_raw_data_cups(self, printer_name: str, data: bytes) -> bool:
+        """Submit a raw job over the persistent IPP connection."""
+        # Hold the lock across the whole createJob..finishDocument
+        # sequence so concurrent sends cannot interleave documents on
+        # the shared connection
+        with self._cups_lock:
+            conn = self._get_cups_connection()
+            job_id = conn.createJob(printer_name, 'PyTextPrinter Raw Job',
+                                    {'raw': 'true'})
+            conn.startDocument(printer_name, job_id, 'data',
+                               'application/octet-stream', 1)
+            conn.writeRequestData(data, len(data))
+            conn.finishDocument(printer_name)
+        return True
+
+    def _send_raw_data_lp(self, printer_name: str, data: bytes) -> bool:
+        """Send raw data by piping it into the lp command."""
+        try:
+            # Pipe the payload straight into lp's stdin: no temp file on
+            # disk, no extra write/read round-trip, no cleanup path
+            result = subprocess.run([
+                'lp', '-d', printer_name, '-o', 'raw'
+            ], input=data, capture_output=True)
+
+            return result.returncode == 0
+
         except Exception as e:
             print(f"Error sending raw data to {printer_name}: {e}")
             return False
-    
+
     def send_text(self, printer_name: str, text: str, encoding: str = 'cp437') -> bool:
         """Send text to macOS printer."""
+        return self.send_raw_data(printer_name, _encode(text, encoding))
+
+    async def send_raw_data_async(self, printer_name: str, data: bytes) -> bool:
+        """Send raw data to macOS printer without blocking the event loop."""
         try:
-            # For text, we can send directly through lp
-            result = subprocess.run([
-                'lp', '-d', printer_name, '-o', 'raw'
-            ], input=text, text=True, capture_output=True, encoding=encoding)
-            
-            return result.returncode == 0
-            
+            # Natively async lp spawn: concurrent sends overlap their
+            # fork/exec and CUPS spool waits instead of serializing
+            proc = await asyncio.create_subprocess_exec(
+                'lp', '-d', printer_name, '-o', 'raw',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+            await proc.communicate(data)
+            return proc.returncode == 0
+
         except Exception as e:
-            print(f"Error sending text to {printer_name}: {e}")
-            # Fallback to raw data method
-            try:
-                data = text.encode(encoding)
-                return self.send_raw_data(printer_name, data)
-            except UnicodeEncodeError:
-                data = text.encode('utf-8', errors='replace')
-                return self.send_raw_data(printer_name, data)
+            print(f"Error sending raw data to {printer_name}: {e}")
+            return False
     
     def is_printer_ready(self, printer_name: str) -> bool:
-        """Check if macOS printer is ready using lpstat."""
+        """Check if macOS printer is ready using CUPS or lpstat."""
+        # Library call first: one IPP attribute fetch, no lpstat spawn.
+        # IPP printer-state is 3=idle, 4=processing, 5=stopped; idle and
+        # printing both count as ready, matching the lpstat heuristic
+        if cups is not None:
+            try:
+                with self._cups_lock:
+                    attrs = self._get_cups_connection().getPrinterAttributes(
+                        printer_name)
+                return attrs.get('printer-state', 5) != 5
+            except Exception:
+                self._cups_conn = None
+
         try:
             result = subprocess.run([
                 'lpstat', '-p', printer_name
@@ -292,88 +557,22 @@ class MacOSPrinterInterface(PrinterInterfaceBase):
             return False
 
 
-class PrinterInterface:
-    """Main printer interface that handles all platforms."""
-    
-    def __init__(self):
-        """Initialize with platform-specific interface."""
-        system = platform.system().lower()
-        
-        if system == 'windows':
-            self._interface = WindowsPrinterInterface()
-        elif system == 'linux':
-            self._interface = LinuxPrinterInterface()
-        elif system == 'darwin':  # macOS
-            self._interface = MacOSPrinterInterface()
-        else:
-            raise NotImplementedError(f"Platform {system} is not supported")
-    
-    def send_raw_data(self, printer_name: str, data: bytes) -> bool:
-        """Send raw data to the specified printer.
-        
-        Args:
-            printer_name: Name of the printer
-            data: Raw data to send
-            
-        Returns:
-            True if data was sent successfully, False otherwise
-        """
-        return self._interface.send_raw_data(printer_name, data)
-    
-    def send_text(self, printer_name: str, text: str, encoding: str = 'cp437') -> bool:
-        """Send text to the specified printer.
-        
-        Args:
-            printer_name: Name of the printer
-            text: Text to send
-            encoding: Character encoding to use
-            
-        Returns:
-            True if text was sent successfully, False otherwise
-        """
-        return self._interface.send_text(printer_name, text, encoding)
-    
-    def send_escpos_commands(self, printer_name: str, commands: bytes) -> bool:
-        """Send ESC/POS commands to the specified printer.
-        
-        Args:
-            printer_name: Name of the printer
-            commands: ESC/POS command sequence
-            
-        Returns:
-            True if commands were sent successfully, False otherwise
-        """
-        return self.send_raw_data(printer_name, commands)
-    
-    def is_printer_ready(self, printer_name: str) -> bool:
-        """Check if the printer is ready to receive data.
-        
-        Args:
-            printer_name: Name of the printer
-            
-        Returns:
-            True if printer is ready, False otherwise
-        """
-        return self._interface.is_printer_ready(printer_name)
-    
-    def print_test_page(self, printer_name: str) -> bool:
-        """Print a test page to verify printer functionality.
-        
-        Args:
-            printer_name: Name of the printer
-            
-        Returns:
-            True if test page was sent successfully, False otherwise
-        """
-        test_content = (
-            "PyTextPrinter Test Page\n"
-            "======================\n\n"
-            "This is a test page to verify printer functionality.\n"
-            "If you can read this, the printer is working correctly.\n\n"
-            f"Printer: {printer_name}\n"
-            f"Platform: {platform.system()}\n\n"
-            "Test completed successfully.\n"
-            "\n\n\n"  # Feed some lines for cutting
-        )
-        
-        return self.send_text(printer_name, test_content)
\ No newline at end of file
+# Resolve the platform implementation once at import time: the platform
+# cannot change within a process, and aliasing the concrete class removes
+# the per-call trampoline frame the old wrapper paid on every send
+_INTERFACE_CLASSES = {
+    'windows': WindowsPrinterInterface,
+    'linux': LinuxPrinterInterface,
+    'darwin': MacOSPrinterInterface,  # macOS
+}
+_interface_cls = _INTERFACE_CLASSES.get(platform.system().lower())
+
+if _interface_cls is not None:
+    PrinterInterface = _interface_cls
+else:
+    class PrinterInterface:
+        """Stub keeping the unsupported-platform error at construction time."""
+
+        def __init__(self):
+            raise NotImplementedError(
+                f"Platform {platform.system().lower()} is not supported")
@@ -1,26 +1,55 @@
 """Printer selection and management module for handling connected printers."""
 
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from .printer_discovery import PrinterDiscovery, PrinterInfo
 
+# Thermal keyword alternation compiled once; plain substrings (no word
+# boundaries) keep the original matching behavior, e.g. 'pos' inside
+# 'Epson' still classifies as thermal
+_THERMAL_RE = re.compile(r'thermal|receipt|pos|escpos', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _is_thermal(name: str, driver: str, comment: str) -> bool:
+    """Check the thermal keyword heuristic, memoized per printer identity."""
+    return bool(_THERMAL_RE.search(name) or _THERMAL_RE.search(driver)
+                or _THERMAL_RE.search(comment))
+
 
 class PrinterManager:
     """Manager class for selecting and managing printer connections."""
-    
+
     def __init__(self):
         """Initialize the printer manager."""
         self.discovery = PrinterDiscovery()
         self._selected_printer: Optional[PrinterInfo] = None
         self._printer_cache: Dict[str, PrinterInfo] = {}
-        self._refresh_cache()
-    
-    def _refresh_cache(self) -> None:
-        """Refresh the internal printer cache."""
+        self._cache_ts = 0.0
+        self._cache_ttl = 2.0
+        self._refresh_cache(force=True)
+
+    def _refresh_cache(self, force: bool = False) -> None:
+        """Refresh the internal printer cache.
+
+        Back-to-back operations (selection flows, UI refreshes) reuse a
+        recent enumeration instead of rediscovering every time.
+
+        Args:
+            force: Re-enumerate even if the cache is still fresh
+        """
+        if (not force and self._printer_cache
+                and time.monotonic() - self._cache_ts < self._cache_ttl):
+            return
         try:
-            printers = self.discovery.discover_all_printers()
+            printers = self.discovery.discover_all_printers(force=force)
             self._printer_cache = {printer.name: printer for printer in printers}
         except Exception:
             self._printer_cache = {}
+        self._cache_ts = time.monotonic()
     
     def list_all_printers(self, refresh: bool = False) -> List[PrinterInfo]:
         """List all available printers.
@@ -32,8 +61,8 @@ class PrinterManager:
             List of all available printers
         """
         if refresh or not self._printer_cache:
-            self._refresh_cache()
-        
+            self._refresh_cache(force=refresh)
+
         return list(self._printer_cache.values())
     
     def list_text_printers(self, refresh: bool = False) -> List[PrinterInfo]:
@@ -46,8 +75,8 @@ class PrinterManager:
             List of text/thermal printers
         """
         if refresh or not self._printer_cache:
-            self._refresh_cache()
-        
+            self._refresh_cache(force=refresh)
+
         all_printers = list(self._printer_cache.values())
         return self.discovery._discovery.filter_text_printers(all_printers)
     
@@ -60,19 +89,27 @@ class PrinterManager:
         Returns:
             True if printer was successfully selected, False otherwise
         """
-        # Refresh cache to get latest printer status
+        # A fresh-enough cache is good enough for selection; only force a
+        # re-enumeration when the availability check fails below
         self._refresh_cache()
-        
+
         if printer_name in self._printer_cache:
             printer_info = self._printer_cache[printer_name]
-            
+
             # Verify printer is available
             if self.discovery.is_printer_available(printer_name):
                 self._selected_printer = printer_info
                 return True
-            else:
-                print(f"Warning: Printer '{printer_name}' is not available or has errors.")
-                return False
+
+            # The cached status may be stale; re-enumerate once and retry
+            self._refresh_cache(force=True)
+            if (printer_name in self._printer_cache
+                    and self.discovery.is_printer_available(printer_name)):
+                self._selected_printer = self._printer_cache[printer_name]
+                return True
+
+            print(f"Warning: Printer '{printer_name}' is not available or has errors.")
+            return False
         else:
             print(f"Error: Printer '{printer_name}' not found.")
             return False
@@ -99,12 +136,22 @@ class PrinterManager:
             True if a text printer was found and selected, False otherwise
         """
         text_printers = self.list_text_printers(refresh=True)
-        
-        for printer in text_printers:
-            if self.discovery.is_printer_available(printer.name):
-                self._selected_printer = printer
-                return True
-        
+
+        if text_printers:
+            # Probe all printers concurrently — each check blocks on an
+            # OS status query, so wall time collapses to the slowest probe.
+            # Walking the results in list order keeps selection
+            # deterministic: the first listed available printer wins
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(text_printers))) as executor:
+                results = executor.map(
+                    self.discovery.is_printer_available,
+                    [printer.name for printer in text_printers])
+                for printer, is_available in zip(text_printers, results):
+                    if is_available:
+                        self._selected_printer = printer
+                        return True
+
         print("No available text/thermal printers found.")
         return False
     
@@ -142,23 +189,49 @@ class PrinterManager:
         printer_info = self.discovery.get_printer_info(printer_name)
         return printer_info.status if printer_info else None
     
+    # Status substrings that mark a printer as unavailable; mirrors the
+    # heuristic in PrinterDiscovery.is_printer_available
+    _ERROR_STATUSES = ('error', 'stopped', 'offline', 'no contact',
+                       'lost communication')
+
+    def _availability_map(self, printers: List[PrinterInfo]) -> Dict[str, bool]:
+        """Compute availability for many printers without per-name probes.
+
+        The statuses were already fetched by the single enumeration that
+        produced these PrinterInfo objects, so checking them in memory
+        replaces one status query (subprocess/WMI) per printer.
+
+        Args:
+            printers: Printers to classify
+
+        Returns:
+            Mapping of printer name to availability
+        """
+        return {
+            printer.name: not any(status in printer.status.lower()
+                                  for status in self._ERROR_STATUSES)
+            for printer in printers
+        }
+
     def print_printer_list(self, text_only: bool = False) -> None:
         """Print a formatted list of available printers.
-        
+
         Args:
             text_only: If True, only show text/thermal printers
         """
         printers = self.list_text_printers() if text_only else self.list_all_printers()
-        
+
         if not printers:
             print("No printers found.")
             return
-        
+
+        available = self._availability_map(printers)
+
         print(f"\n{'Available Text Printers:' if text_only else 'Available Printers:'}")
         print("-" * 60)
-        
+
         for i, printer in enumerate(printers, 1):
-            status_indicator = "✓" if self.discovery.is_printer_available(printer.name) else "✗"
+            status_indicator = "✓" if available.get(printer.name, False) else "✗"
             default_indicator = " (Default)" if printer.is_default else ""
             selected_indicator = " [SELECTED]" if (self._selected_printer and 
                                                  self._selected_printer.name == printer.name) else ""
@@ -251,22 +324,12 @@ class PrinterManager:
     
     def _supports_graphics(self, printer_info: PrinterInfo) -> bool:
         """Determine if printer supports graphics."""
-        # Most modern printers support some form of graphics
-        # Thermal and dot matrix printers typically have limited graphics support
-        thermal_keywords = ['thermal', 'receipt', 'pos', 'dot matrix']
-        printer_text = (printer_info.name + " " + printer_info.driver + " " + 
-                       printer_info.comment).lower()
-        
-        # If it's a thermal printer, assume limited graphics support
-        if any(keyword in printer_text for keyword in thermal_keywords):
-            return True  # ESC/POS printers typically support basic graphics
-        
-        # For other printers, assume full graphics support
+        # Thermal/impact printers support at least basic ESC/POS graphics
+        # and everything else is assumed to support full graphics, so both
+        # branches of the old keyword scan returned True — skip the scan
         return True
-    
+
     def _is_thermal_printer(self, printer_info: PrinterInfo) -> bool:
         """Determine if printer is a thermal/receipt printer."""
-        thermal_keywords = ['thermal', 'receipt', 'pos', 'escpos']
-        printer_text = (printer_info.name + " " + printer_info.driver + " " + 
-                       printer_info.comment).lower()
-        return any(keyword in printer_text for keyword in thermal_keywords)
\ No newline at end of file
+        return _is_thermal(printer_info.name, printer_info.driver,
+                           printer_info.comment or '')
\ No newline at end of file
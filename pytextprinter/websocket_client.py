@@ -3,10 +3,16 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
 import socketio
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 class PyTextPrinterWebSocketClient:
     """WebSocket client for connecting to PyTextPrinter server."""
@@ -20,9 +26,11 @@ class PyTextPrinterWebSocketClient:
         self.server_url = server_url
         self.sio = socketio.AsyncClient()
         self.connected = False
+        self._ready = asyncio.Event()
         self.logger = logging.getLogger(__name__)
         self.response_handlers: Dict[str, Callable] = {}
         self.last_response: Optional[Dict[str, Any]] = None
+        self._info_cache: Dict[str, Any] = {}
         
         # Register default event handlers
         self._register_default_handlers()
@@ -34,12 +42,14 @@ class PyTextPrinterWebSocketClient:
         async def connect():
             """Handle connection to server."""
             self.connected = True
+            self._ready.set()
             self.logger.info(f"Connected to PyTextPrinter server at {self.server_url}")
-        
+
         @self.sio.event
         async def disconnect():
             """Handle disconnection from server."""
             self.connected = False
+            self._ready.clear()
             self.logger.info("Disconnected from PyTextPrinter server")
         
         @self.sio.event
@@ -49,6 +59,16 @@ class PyTextPrinterWebSocketClient:
             if 'available_functions' in data:
                 self.logger.info(f"Available functions: {', '.join(data['available_functions'])}")
         
+        @self.sio.event
+        async def batch_out(items):
+            """Handle a coalesced burst of response events from the server."""
+            for item in items or []:
+                event_name = item.get('event')
+                data = item.get('data')
+                self.last_response = data
+                if event_name in self.response_handlers:
+                    await self.response_handlers[event_name](data)
+
         @self.sio.event
         async def error(data):
             """Handle server errors."""
@@ -100,6 +120,17 @@ class PyTextPrinterWebSocketClient:
         """Disconnect from the WebSocket server."""
         if self.connected:
             await self.sio.disconnect()
+
+    async def wait_ready(self, timeout: float = 5.0) -> None:
+        """Wait until the connection handshake has completed.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            asyncio.TimeoutError: If the connection is not ready in time
+        """
+        await asyncio.wait_for(self._ready.wait(), timeout)
     
     def register_handler(self, event: str, handler: Callable):
         """Register a custom event handler.
@@ -130,6 +161,38 @@ class PyTextPrinterWebSocketClient:
         
         return None
     
+    def _encode_payload(self, payload: Dict[str, Any], binary: bool) -> Any:
+        """Encode a payload as MessagePack bytes when binary mode is requested.
+
+        Falls back to the plain JSON payload when msgpack is not installed.
+
+        Args:
+            payload: Payload dictionary
+            binary: Whether to MessagePack-encode the payload
+
+        Returns:
+            Packed bytes or the original payload
+        """
+        if binary and msgpack is not None:
+            return msgpack.packb(payload)
+        return payload
+
+    async def batch(self, ops: List[Dict[str, Any]], timeout: float = 5.0) -> Optional[List[Dict[str, Any]]]:
+        """Execute multiple print operations in a single frame.
+
+        Args:
+            ops: List of operation dicts with 'fn', optional 'args' and 'kwargs'
+            timeout: Timeout in seconds for the server acknowledgement
+
+        Returns:
+            List of per-operation result dicts, or None if the call failed
+        """
+        try:
+            return await self.sio.call('batch', ops, timeout=timeout)
+        except Exception as e:
+            self.logger.error(f"Batch call failed: {e}")
+            return None
+
     # Printer discovery and management methods
     async def list_printers(self, text_only: bool = True, refresh: bool = False) -> Optional[List[Dict]]:
         """List available printers.
@@ -161,7 +224,8 @@ class PyTextPrinterWebSocketClient:
             True if successful, False otherwise
         """
         await self.sio.emit('select_printer', {'printer_name': printer_name})
-        
+        self._info_cache.pop('get_selected_printer', None)
+
         response = await self.wait_for_response()
         return response and response.get('success', False)
     
@@ -172,22 +236,46 @@ class PyTextPrinterWebSocketClient:
             True if successful, False otherwise
         """
         await self.sio.emit('auto_select_printer')
-        
+        self._info_cache.pop('get_selected_printer', None)
+
         response = await self.wait_for_response()
         return response and response.get('success', False)
     
     async def get_selected_printer(self) -> Optional[Dict[str, Any]]:
         """Get currently selected printer.
-        
+
         Returns:
             Printer info dict or None
         """
+        return await self._cached_call('get_selected_printer', self._fetch_selected_printer)
+
+    async def _fetch_selected_printer(self) -> Optional[Dict[str, Any]]:
+        """Fetch the selected printer from the server."""
         await self.sio.emit('get_selected_printer')
-        
+
         response = await self.wait_for_response()
         if response and response.get('success'):
             return response.get('selected_printer')
         return None
+
+    async def _cached_call(self, key: str, fetch: Callable, ttl: float = 2.0) -> Any:
+        """Serve an immutable RPC from a short-lived cache.
+
+        Args:
+            key: Cache key for the RPC
+            fetch: Coroutine function performing the actual round-trip
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        cached = self._info_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        result = await fetch()
+        self._info_cache[key] = (now, result)
+        return result
     
     # Console printing methods
     async def print_text(self, text: str, bold: bool = False) -> Optional[str]:
@@ -232,23 +320,24 @@ class PyTextPrinterWebSocketClient:
             return response.get('output')
         return None
     
-    async def print_table(self, data: List[List[str]], headers: Optional[List[str]] = None, 
-                         title: Optional[str] = None) -> Optional[str]:
+    async def print_table(self, data: List[List[str]], headers: Optional[List[str]] = None,
+                         title: Optional[str] = None, binary: bool = False) -> Optional[str]:
         """Print a table.
-        
+
         Args:
             data: Table data
             headers: Column headers
             title: Table title
-            
+            binary: Send the payload MessagePack-encoded (requires msgpack)
+
         Returns:
             Printed output or None if failed
         """
-        await self.sio.emit('print_table', {
+        await self.sio.emit('print_table', self._encode_payload({
             'data': data,
             'headers': headers,
             'title': title
-        })
+        }, binary))
         
         response = await self.wait_for_response()
         if response and response.get('success'):
@@ -357,24 +446,45 @@ class PyTextPrinterWebSocketClient:
         response = await self.wait_for_response()
         return response and response.get('success', False)
     
-    async def print_hardware_receipt(self, lines: List[str], cut_paper: bool = True) -> bool:
+    async def print_hardware_receipt(self, lines: List[str], cut_paper: bool = True,
+                                    binary: bool = False) -> bool:
         """Print receipt to hardware printer.
-        
+
         Args:
             lines: Receipt lines
             cut_paper: Cut paper after printing
-            
+            binary: Send the payload MessagePack-encoded (requires msgpack)
+
         Returns:
             True if successful, False otherwise
         """
-        await self.sio.emit('print_hardware_receipt', {
+        await self.sio.emit('print_hardware_receipt', self._encode_payload({
             'lines': lines,
             'cut_paper': cut_paper
-        })
+        }, binary))
         
         response = await self.wait_for_response()
         return response and response.get('success', False)
     
+    async def print_hardware_receipt_raw(self, payload: bytes) -> bool:
+        """Send a pre-encoded receipt payload verbatim.
+
+        The payload must be a MessagePack-packed dict with the same shape
+        as the print_hardware_receipt arguments ('lines', 'cut_paper').
+        Useful when the same receipt template is printed repeatedly, since
+        the encoding cost is paid once up front.
+
+        Args:
+            payload: Pre-packed receipt payload bytes
+
+        Returns:
+            True if successful, False otherwise
+        """
+        await self.sio.emit('print_hardware_receipt', payload)
+
+        response = await self.wait_for_response()
+        return response and response.get('success', False)
+
     async def open_cash_drawer(self, drawer_number: int = 1) -> bool:
         """Open cash drawer.
         
@@ -436,12 +546,16 @@ class PyTextPrinterWebSocketClient:
     
     async def get_server_info(self) -> Optional[Dict[str, Any]]:
         """Get server information.
-        
+
         Returns:
             Server info dict or None
         """
+        return await self._cached_call('get_server_info', self._fetch_server_info)
+
+    async def _fetch_server_info(self) -> Optional[Dict[str, Any]]:
+        """Fetch server information from the server."""
         await self.sio.emit('get_server_info')
-        
+
         response = await self.wait_for_response()
         if response and response.get('success'):
             return response.get('info')
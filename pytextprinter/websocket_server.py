@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import socket
 import traceback
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
@@ -10,7 +11,13 @@ import socketio
 from aiohttp import web, WSMsgType
 from aiohttp.web import Request, WebSocketResponse
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from .printer import TextPrinter
+from .printer_interface import _to_thread
 from .printer_discovery import PrinterInfo
 from .escpos_commands import BarcodeType, TextAlignment
 
@@ -18,18 +25,27 @@ from .escpos_commands import BarcodeType, TextAlignment
 class PyTextPrinterWebSocketServer:
     """WebSocket server for PyTextPrinter with socket.io compatibility."""
     
-    def __init__(self, host: str = 'localhost', port: int = 8080, cors_allowed_origins: str = "*"):
+    def __init__(self, host: str = 'localhost', port: int = 8080, cors_allowed_origins: str = "*",
+                 compression: bool = False):
         """Initialize WebSocket server.
-        
+
         Args:
             host: Server host address
             port: Server port number
             cors_allowed_origins: CORS allowed origins
+            compression: Enable payload compression; off by default since
+                the typical payloads are tiny and compression is pure CPU
+                overhead on local links
         """
         self.host = host
         self.port = port
         self.printer = TextPrinter()
         self.clients: Dict[str, Dict[str, Any]] = {}
+
+        # One outgoing queue and writer task per connected client, so
+        # bursts of responses coalesce into a single frame
+        self._out_queues: Dict[str, asyncio.Queue] = {}
+        self._writer_tasks: Dict[str, asyncio.Task] = {}
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -40,7 +56,8 @@ class PyTextPrinterWebSocketServer:
             async_mode='aiohttp',
             cors_allowed_origins=cors_allowed_origins,
             logger=True,
-            engineio_logger=True
+            engineio_logger=True,
+            http_compression=compression
         )
         
         # Create aiohttp app
@@ -64,16 +81,21 @@ class PyTextPrinterWebSocketServer:
                 'connected_at': datetime.now(),
                 'last_activity': datetime.now()
             }
-            
+
+            # Start the per-client outgoing writer
+            self._out_queues[sid] = asyncio.Queue()
+            self._writer_tasks[sid] = asyncio.create_task(self._writer(sid))
+
+
             # Send welcome message with available functionality
-            await self.sio.emit('connected', {
+            await self._queue_emit(sid, 'connected', {
                 'message': 'Connected to PyTextPrinter WebSocket server',
                 'available_functions': self._get_available_functions(),
                 'server_info': {
                     'version': '0.1.0',
                     'features': ['console_printing', 'hardware_printing', 'escpos_commands']
                 }
-            }, room=sid)
+            })
         
         @self.sio.event
         async def disconnect(sid):
@@ -81,6 +103,12 @@ class PyTextPrinterWebSocketServer:
             self.logger.info(f"Client {sid} disconnected")
             if sid in self.clients:
                 del self.clients[sid]
+
+            # Tear down the per-client outgoing writer
+            writer_task = self._writer_tasks.pop(sid, None)
+            if writer_task:
+                writer_task.cancel()
+            self._out_queues.pop(sid, None)
         
         # Printer discovery and management
         @self.sio.event
@@ -90,14 +118,16 @@ class PyTextPrinterWebSocketServer:
                 text_only = data.get('text_only', True) if data else True
                 refresh = data.get('refresh', False) if data else False
                 
-                printers = self.printer.list_printers(text_only=text_only, refresh=refresh)
+                printers = await _to_thread(
+                    self.printer.list_printers, text_only=text_only, refresh=refresh
+                )
                 printer_list = [self._printer_info_to_dict(p) for p in printers]
                 
-                await self.sio.emit('printers_list', {
+                await self._queue_emit(sid, 'printers_list', {
                     'success': True,
                     'printers': printer_list,
                     'count': len(printer_list)
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'list_printers', str(e))
@@ -110,14 +140,14 @@ class PyTextPrinterWebSocketServer:
                 if not printer_name:
                     raise ValueError("printer_name is required")
                 
-                success = self.printer.select_printer(printer_name)
+                success = await _to_thread(self.printer.select_printer, printer_name)
                 selected_printer = self.printer.get_selected_printer()
                 
-                await self.sio.emit('printer_selected', {
+                await self._queue_emit(sid, 'printer_selected', {
                     'success': success,
                     'printer_name': printer_name,
                     'selected_printer': self._printer_info_to_dict(selected_printer) if selected_printer else None
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'select_printer', str(e))
@@ -126,13 +156,13 @@ class PyTextPrinterWebSocketServer:
         async def auto_select_printer(sid, data=None):
             """Auto-select first available text printer."""
             try:
-                success = self.printer.auto_select_printer()
+                success = await _to_thread(self.printer.auto_select_printer)
                 selected_printer = self.printer.get_selected_printer()
                 
-                await self.sio.emit('printer_auto_selected', {
+                await self._queue_emit(sid, 'printer_auto_selected', {
                     'success': success,
                     'selected_printer': self._printer_info_to_dict(selected_printer) if selected_printer else None
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'auto_select_printer', str(e))
@@ -143,10 +173,10 @@ class PyTextPrinterWebSocketServer:
             try:
                 selected_printer = self.printer.get_selected_printer()
                 
-                await self.sio.emit('selected_printer_info', {
+                await self._queue_emit(sid, 'selected_printer_info', {
                     'success': True,
                     'selected_printer': self._printer_info_to_dict(selected_printer) if selected_printer else None
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'get_selected_printer', str(e))
@@ -167,11 +197,11 @@ class PyTextPrinterWebSocketServer:
                 temp_printer.print_text(text, bold=bold, end=end)
                 output = output_buffer.getvalue()
                 
-                await self.sio.emit('text_printed', {
+                await self._queue_emit(sid, 'text_printed', {
                     'success': True,
                     'output': output,
                     'type': 'text'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_text', str(e))
@@ -190,11 +220,11 @@ class PyTextPrinterWebSocketServer:
                 temp_printer.print_banner(text, char=char, width=width)
                 output = output_buffer.getvalue()
                 
-                await self.sio.emit('banner_printed', {
+                await self._queue_emit(sid, 'banner_printed', {
                     'success': True,
                     'output': output,
                     'type': 'banner'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_banner', str(e))
@@ -203,6 +233,7 @@ class PyTextPrinterWebSocketServer:
         async def print_table(sid, data):
             """Print a table."""
             try:
+                data = self._unpack_payload(data)
                 table_data = data.get('data', [])
                 headers = data.get('headers')
                 title = data.get('title')
@@ -213,11 +244,11 @@ class PyTextPrinterWebSocketServer:
                 temp_printer.print_table(table_data, headers=headers, title=title)
                 output = output_buffer.getvalue()
                 
-                await self.sio.emit('table_printed', {
+                await self._queue_emit(sid, 'table_printed', {
                     'success': True,
                     'output': output,
                     'type': 'table'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_table', str(e))
@@ -235,11 +266,11 @@ class PyTextPrinterWebSocketServer:
                 temp_printer.print_list(items, bullet=bullet)
                 output = output_buffer.getvalue()
                 
-                await self.sio.emit('list_printed', {
+                await self._queue_emit(sid, 'list_printed', {
                     'success': True,
                     'output': output,
                     'type': 'list'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_list', str(e))
@@ -252,13 +283,13 @@ class PyTextPrinterWebSocketServer:
                 text = data.get('text', '')
                 encoding = data.get('encoding', 'cp437')
                 
-                success = self.printer.print_to_hardware(text, encoding=encoding)
+                success = await _to_thread(self.printer.print_to_hardware, text, encoding=encoding)
                 
-                await self.sio.emit('hardware_printed', {
+                await self._queue_emit(sid, 'hardware_printed', {
                     'success': success,
                     'type': 'hardware_text',
                     'message': 'Text sent to hardware printer' if success else 'Failed to send text to hardware printer'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_to_hardware', str(e))
@@ -271,13 +302,15 @@ class PyTextPrinterWebSocketServer:
                 char = data.get('char', '=')
                 width = data.get('width', 32)
                 
-                success = self.printer.print_hardware_banner(text, char=char, width=width)
+                success = await _to_thread(
+                    self.printer.print_hardware_banner, text, char=char, width=width
+                )
                 
-                await self.sio.emit('hardware_banner_printed', {
+                await self._queue_emit(sid, 'hardware_banner_printed', {
                     'success': success,
                     'type': 'hardware_banner',
                     'message': 'Banner sent to hardware printer' if success else 'Failed to send banner to hardware printer'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_hardware_banner', str(e))
@@ -294,15 +327,16 @@ class PyTextPrinterWebSocketServer:
                 # Convert string to BarcodeType enum
                 barcode_enum = getattr(BarcodeType, barcode_type, BarcodeType.CODE128)
                 
-                success = self.printer.print_hardware_barcode(
+                success = await _to_thread(
+                    self.printer.print_hardware_barcode,
                     barcode_data, barcode_type=barcode_enum, height=height, width=width
                 )
                 
-                await self.sio.emit('hardware_barcode_printed', {
+                await self._queue_emit(sid, 'hardware_barcode_printed', {
                     'success': success,
                     'type': 'hardware_barcode',
                     'message': 'Barcode sent to hardware printer' if success else 'Failed to send barcode to hardware printer'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_hardware_barcode', str(e))
@@ -315,15 +349,16 @@ class PyTextPrinterWebSocketServer:
                 size = data.get('size', 4)
                 error_correction = data.get('error_correction', 1)
                 
-                success = self.printer.print_hardware_qr_code(
+                success = await _to_thread(
+                    self.printer.print_hardware_qr_code,
                     qr_data, size=size, error_correction=error_correction
                 )
                 
-                await self.sio.emit('hardware_qr_printed', {
+                await self._queue_emit(sid, 'hardware_qr_printed', {
                     'success': success,
                     'type': 'hardware_qr',
                     'message': 'QR code sent to hardware printer' if success else 'Failed to send QR code to hardware printer'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_hardware_qr_code', str(e))
@@ -332,16 +367,19 @@ class PyTextPrinterWebSocketServer:
         async def print_hardware_receipt(sid, data):
             """Print receipt to hardware printer."""
             try:
+                data = self._unpack_payload(data)
                 lines = data.get('lines', [])
                 cut_paper = data.get('cut_paper', True)
                 
-                success = self.printer.print_hardware_receipt(lines, cut_paper=cut_paper)
+                success = await _to_thread(
+                    self.printer.print_hardware_receipt, lines, cut_paper=cut_paper
+                )
                 
-                await self.sio.emit('hardware_receipt_printed', {
+                await self._queue_emit(sid, 'hardware_receipt_printed', {
                     'success': success,
                     'type': 'hardware_receipt',
                     'message': 'Receipt sent to hardware printer' if success else 'Failed to send receipt to hardware printer'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'print_hardware_receipt', str(e))
@@ -352,13 +390,13 @@ class PyTextPrinterWebSocketServer:
             try:
                 drawer_number = data.get('drawer_number', 1) if data else 1
                 
-                success = self.printer.open_cash_drawer(drawer_number=drawer_number)
+                success = await _to_thread(self.printer.open_cash_drawer, drawer_number=drawer_number)
                 
-                await self.sio.emit('cash_drawer_opened', {
+                await self._queue_emit(sid, 'cash_drawer_opened', {
                     'success': success,
                     'type': 'cash_drawer',
                     'message': 'Cash drawer command sent' if success else 'Failed to send cash drawer command'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'open_cash_drawer', str(e))
@@ -377,13 +415,13 @@ class PyTextPrinterWebSocketServer:
                 else:
                     raise ValueError("Either commands_hex or commands_bytes is required")
                 
-                success = self.printer.send_escpos_to_hardware(commands)
+                success = await _to_thread(self.printer.send_escpos_to_hardware, commands)
                 
-                await self.sio.emit('raw_escpos_sent', {
+                await self._queue_emit(sid, 'raw_escpos_sent', {
                     'success': success,
                     'type': 'raw_escpos',
                     'message': 'Raw ESC/POS commands sent' if success else 'Failed to send raw ESC/POS commands'
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'send_raw_escpos', str(e))
@@ -394,13 +432,13 @@ class PyTextPrinterWebSocketServer:
             """Get printer status."""
             try:
                 printer_name = data.get('printer_name') if data else None
-                status = self.printer.get_printer_status(printer_name)
+                status = await _to_thread(self.printer.get_printer_status, printer_name)
                 
-                await self.sio.emit('printer_status', {
+                await self._queue_emit(sid, 'printer_status', {
                     'success': True,
                     'status': status,
                     'printer_name': printer_name
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'get_printer_status', str(e))
@@ -410,21 +448,35 @@ class PyTextPrinterWebSocketServer:
             """Check if printer is ready."""
             try:
                 printer_name = data.get('printer_name') if data else None
-                is_ready = self.printer.is_hardware_printer_ready(printer_name)
+                is_ready = await _to_thread(self.printer.is_hardware_printer_ready, printer_name)
                 
-                await self.sio.emit('printer_ready_status', {
+                await self._queue_emit(sid, 'printer_ready_status', {
                     'success': True,
                     'is_ready': is_ready,
                     'printer_name': printer_name
-                }, room=sid)
+                })
                 
             except Exception as e:
                 await self._send_error(sid, 'is_printer_ready', str(e))
         
+        @self.sio.event
+        async def batch(sid, ops):
+            """Execute multiple operations from one frame and ack the results."""
+            results = []
+            for op in ops or []:
+                fn = op.get('fn')
+                try:
+                    results.append(await self._dispatch_batch_op(
+                        fn, op.get('args', []), op.get('kwargs', {})
+                    ))
+                except Exception as e:
+                    results.append({'success': False, 'type': fn, 'error': str(e)})
+            return results
+
         @self.sio.event
         async def get_server_info(sid, data=None):
             """Get server information."""
-            await self.sio.emit('server_info', {
+            await self._queue_emit(sid, 'server_info', {
                 'success': True,
                 'info': {
                     'version': '0.1.0',
@@ -432,7 +484,7 @@ class PyTextPrinterWebSocketServer:
                     'available_functions': self._get_available_functions(),
                     'current_printer': self._printer_info_to_dict(self.printer.get_selected_printer())
                 }
-            }, room=sid)
+            })
     
     def _setup_http_routes(self):
         """Setup HTTP routes for web interface."""
@@ -495,6 +547,61 @@ socket.emit('print_to_hardware', {text: 'Hello Hardware!'});
         self.app.router.add_get('/', index)
         self.app.router.add_get('/health', health)
     
+    # Functions that can be invoked through the 'batch' event
+    _CONSOLE_BATCH_FUNCTIONS = frozenset([
+        'print_text', 'print_banner', 'print_table', 'print_list', 'print_dict'
+    ])
+    _HARDWARE_BATCH_FUNCTIONS = frozenset([
+        'print_to_hardware', 'print_hardware_banner', 'print_hardware_barcode',
+        'print_hardware_qr_code', 'print_hardware_receipt', 'open_cash_drawer'
+    ])
+
+    def _unpack_payload(self, data: Any) -> Any:
+        """Decode a MessagePack-encoded payload if the client sent one.
+
+        Args:
+            data: Event payload, either a plain dict or packed bytes
+
+        Returns:
+            Decoded payload dictionary
+        """
+        if isinstance(data, (bytes, bytearray)):
+            if msgpack is None:
+                raise ValueError("msgpack is required to decode binary payloads")
+            return msgpack.unpackb(data, raw=False)
+        return data
+
+    async def _dispatch_batch_op(self, fn: str, args: List[Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a single batched operation.
+
+        Console operations render into an in-memory buffer and run
+        inline; hardware operations block on the printer transport, so
+        they run in a worker thread like the per-event handlers.
+
+        Args:
+            fn: Name of the printer function to call
+            args: Positional arguments for the function
+            kwargs: Keyword arguments for the function
+
+        Returns:
+            Result dictionary matching the per-event response shape
+        """
+        if fn in self._CONSOLE_BATCH_FUNCTIONS:
+            import io
+            output_buffer = io.StringIO()
+            temp_printer = TextPrinter(output=output_buffer)
+            getattr(temp_printer, fn)(*args, **kwargs)
+            return {
+                'success': True,
+                'output': output_buffer.getvalue(),
+                'type': fn
+            }
+        elif fn in self._HARDWARE_BATCH_FUNCTIONS:
+            success = await _to_thread(getattr(self.printer, fn), *args, **kwargs)
+            return {'success': success, 'type': fn}
+        else:
+            raise ValueError(f"Unknown batch function: {fn}")
+
     def _get_available_functions(self) -> List[str]:
         """Get list of available WebSocket functions."""
         return [
@@ -502,7 +609,8 @@ socket.emit('print_to_hardware', {text: 'Hello Hardware!'});
             'print_text', 'print_banner', 'print_table', 'print_list',
             'print_to_hardware', 'print_hardware_banner', 'print_hardware_barcode',
             'print_hardware_qr_code', 'print_hardware_receipt', 'open_cash_drawer',
-            'send_raw_escpos', 'get_printer_status', 'is_printer_ready', 'get_server_info'
+            'send_raw_escpos', 'get_printer_status', 'is_printer_ready', 'get_server_info',
+            'batch'
         ]
     
     def _printer_info_to_dict(self, printer_info: Optional[PrinterInfo]) -> Optional[Dict[str, Any]]:
@@ -521,15 +629,98 @@ socket.emit('print_to_hardware', {text: 'Hello Hardware!'});
             'comment': printer_info.comment
         }
     
+    async def _queue_emit(self, sid: str, event: str, data: Dict[str, Any]) -> None:
+        """Send a response to a client through its outgoing queue.
+
+        Falls back to a direct emit when no queue exists for the client
+        (e.g. during connection teardown).
+
+        Args:
+            sid: Client session id
+            event: Event name
+            data: Event payload
+        """
+        queue = self._out_queues.get(sid)
+        if queue is not None:
+            queue.put_nowait((event, data))
+        else:
+            await self.sio.emit(event, data, room=sid)
+
+    async def _writer(self, sid: str) -> None:
+        """Drain a client's outgoing queue, coalescing bursts into one frame.
+
+        Single pending messages are emitted under their original event name;
+        when several responses are queued at once they are merged into a
+        single 'batch_out' frame.
+
+        Args:
+            sid: Client session id
+        """
+        queue = self._out_queues[sid]
+        try:
+            while True:
+                message = await queue.get()
+                messages = [message]
+                while not queue.empty():
+                    messages.append(queue.get_nowait())
+
+                if len(messages) == 1:
+                    event, data = messages[0]
+                    await self.sio.emit(event, data, room=sid)
+                else:
+                    # Cork the client socket around the burst (Linux only)
+                    # so the merged frame leaves in a single segment
+                    sock = self._client_socket(sid) if hasattr(socket, 'TCP_CORK') else None
+                    if sock is not None:
+                        self._set_cork(sock, True)
+                    try:
+                        await self.sio.emit('batch_out', [
+                            {'event': event, 'data': data} for event, data in messages
+                        ], room=sid)
+                    finally:
+                        if sock is not None:
+                            self._set_cork(sock, False)
+        except asyncio.CancelledError:
+            pass
+
+    def _client_socket(self, sid: str) -> Optional[socket.socket]:
+        """Best-effort lookup of the raw TCP socket for a connected client.
+
+        Returns None when the transport cannot be reached (polling
+        transport, connection teardown, or internal layout changes).
+
+        Args:
+            sid: Client session id
+        """
+        try:
+            eio_sid = self.sio.manager.eio_sid_from_sid(sid, '/')
+            eio_socket = self.sio.eio.sockets.get(eio_sid)
+            ws = getattr(eio_socket, 'ws', None)
+            writer = getattr(ws, '_writer', None)
+            transport = getattr(writer, 'transport', None)
+            if transport is not None:
+                return transport.get_extra_info('socket')
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _set_cork(sock: socket.socket, enabled: bool) -> None:
+        """Toggle TCP_CORK on a socket, ignoring platforms that lack it."""
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1 if enabled else 0)
+        except OSError:
+            pass
+
     async def _send_error(self, sid: str, event: str, error_message: str):
         """Send error message to client."""
         self.logger.error(f"Error in {event}: {error_message}")
-        await self.sio.emit('error', {
+        await self._queue_emit(sid, 'error', {
             'success': False,
             'event': event,
             'error': error_message,
             'timestamp': datetime.now().isoformat()
-        }, room=sid)
+        })
     
     async def start_server(self):
         """Start the WebSocket server."""
@@ -539,7 +730,18 @@ socket.emit('print_to_hardware', {text: 'Hello Hardware!'});
         await runner.setup()
         site = web.TCPSite(runner, self.host, self.port)
         await site.start()
-        
+
+        # Disable Nagle's algorithm on the listening sockets so small
+        # Socket.IO ack frames are sent immediately instead of being
+        # held back for up to 40 ms
+        server = getattr(site, '_server', None)
+        if server is not None and server.sockets:
+            for sock in server.sockets:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
+
         self.logger.info(f"Server started successfully!")
         self.logger.info(f"WebSocket URL: ws://{self.host}:{self.port}")
         self.logger.info(f"Socket.IO URL: http://{self.host}:{self.port}")
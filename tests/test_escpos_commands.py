@@ -179,6 +179,68 @@ class TestESCPOSCommandBuilder:
         assert ESCPOSCommands.PRINT_BARCODE in commands
         assert b"123456789" in commands
     
+    def test_barcode_non_ascii_raises(self):
+        """Test that non-ASCII barcode data is rejected."""
+        with pytest.raises(ValueError):
+            self.builder.barcode("café123", BarcodeType.CODE128)
+
+        # Nothing should have been emitted for the rejected barcode
+        assert self.builder.get_commands() == b''
+
+    def test_barcodes_bulk_matches_repeated_barcode(self):
+        """Test that barcodes_bulk emits the same bytes as barcode() calls."""
+        items = [
+            ("123456789", BarcodeType.CODE128, 100, 3),
+            ("987654321", BarcodeType.CODE39, 162, 2),
+        ]
+
+        bulk = self.builder.barcodes_bulk(items).get_commands()
+
+        single = ESCPOSCommandBuilder()
+        for data, barcode_type, height, width in items:
+            single.barcode(data, barcode_type, height=height, width=width)
+
+        assert bulk == single.get_commands()
+
+    def test_barcodes_bulk_non_ascii_raises(self):
+        """Test that barcodes_bulk rejects the whole batch on bad data."""
+        items = [
+            ("123456789", BarcodeType.CODE128, 100, 3),
+            ("café", BarcodeType.CODE128, 100, 3),
+        ]
+
+        with pytest.raises(ValueError):
+            self.builder.barcodes_bulk(items)
+
+        assert self.builder.get_commands() == b''
+
+    def test_preset(self):
+        """Test built-in preset emission."""
+        commands = self.builder.preset('receipt_header').get_commands()
+
+        assert ESCPOSCommands.INIT in commands
+        assert ESCPOSCommands.ALIGN_CENTER in commands
+        assert ESCPOSCommands.BOLD_ON in commands
+
+    def test_preset_unknown_raises(self):
+        """Test that an unknown preset name raises KeyError."""
+        with pytest.raises(KeyError):
+            self.builder.preset('no_such_preset')
+
+    def test_register_preset(self):
+        """Test registering and replaying a custom preset."""
+        ESCPOSCommandBuilder.register_preset(
+            'test_custom', lambda b: b.bold(True).text("HDR").bold(False))
+
+        commands = self.builder.preset('test_custom').get_commands()
+
+        expected = (ESCPOSCommandBuilder()
+                   .bold(True)
+                   .text("HDR")
+                   .bold(False)
+                   .get_commands())
+        assert commands == expected
+
     def test_qr_code(self):
         """Test QR code printing."""
         commands = self.builder.qr_code("Hello QR", size=4).get_commands()
@@ -49,6 +49,27 @@ class TestTextPrinter:
         assert "Age" in output
         assert "|" in output  # Table borders
     
+    def test_print_lines(self):
+        """Test batched line printing."""
+        lines = ["Line 1", "Line 2", "Line 3"]
+        self.printer.print_lines(lines)
+        output = self.output.getvalue()
+        assert output == "Line 1\nLine 2\nLine 3\n"
+
+    def test_print_lines_bold(self):
+        """Test batched bold line printing."""
+        self.printer.print_lines(["Line 1", "Line 2"], bold=True)
+        output = self.output.getvalue()
+        assert output.count("\033[1m") == 2
+        assert output.count("\033[0m") == 2
+        assert "Line 1" in output
+        assert "Line 2" in output
+
+    def test_print_lines_empty(self):
+        """Test that an empty batch prints nothing."""
+        self.printer.print_lines([])
+        assert self.output.getvalue() == ""
+
     def test_print_list(self):
         """Test list printing."""
         items = ["Item 1", "Item 2", "Item 3"]
@@ -68,6 +89,22 @@ class TestTextPrinter:
         assert "key2:" in output
         assert "value2" in output
     
+    def test_format_banner(self):
+        """Test banner formatting without printing."""
+        banner = self.printer.format_banner("Test", width=20)
+        assert self.output.getvalue() == ""
+        lines = banner.split('\n')
+        assert len(lines) == 3
+        assert "Test" in lines[1]
+
+    def test_format_table(self):
+        """Test table formatting without printing."""
+        data = [["Alice", "25"], ["Bob", "30"]]
+        table = self.printer.format_table(data, headers=["Name", "Age"])
+        assert self.output.getvalue() == ""
+        assert "Alice" in table
+        assert "|" in table
+
     def test_print_progress_bar(self):
         """Test progress bar printing."""
         self.printer.print_progress_bar(0.5, width=10)
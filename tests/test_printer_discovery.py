@@ -1,5 +1,7 @@
 """Test cases for printer discovery functionality."""
 
+import io
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pytextprinter.printer_discovery import (
@@ -106,15 +108,19 @@ COMPUTER,,TRUE,Epson TM Driver,,Epson TM-T88V,USB002,2,FALSE
 @patch('subprocess.run')
 class TestLinuxPrinterDiscovery:
     """Test cases for Linux printer discovery."""
-    
-    def test_discover_printers_success(self, mock_run):
+
+    @patch('subprocess.Popen')
+    def test_discover_printers_success(self, mock_popen, mock_run):
         """Test successful printer discovery on Linux."""
         mock_output = """printer HP_LaserJet is idle.  enabled since Mon 01 Jan 2024 12:00:00 PM EST
 printer Epson_TM is idle.  enabled since Mon 01 Jan 2024 12:00:00 PM EST
 system default destination: Epson_TM
 """
-        mock_run.return_value = Mock(returncode=0, stdout=mock_output)
-        
+        mock_proc = Mock()
+        mock_proc.stdout = io.StringIO(mock_output)
+        mock_proc.wait.return_value = 0
+        mock_popen.return_value = mock_proc
+
         discovery = LinuxPrinterDiscovery()
         printers = discovery.discover_printers()
         
@@ -0,0 +1,41 @@
+"""Test cases for WebSocket server batch dispatch."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from pytextprinter.websocket_server import PyTextPrinterWebSocketServer
+
+
+class TestBatchDispatch:
+    """Test cases for the batch RPC dispatcher."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.server = PyTextPrinterWebSocketServer()
+
+    def test_dispatch_console_op(self):
+        """Test dispatching a console operation."""
+        result = asyncio.run(self.server._dispatch_batch_op(
+            'print_text', ['Hello Batch'], {}))
+
+        assert result['success'] == True
+        assert result['type'] == 'print_text'
+        assert 'Hello Batch' in result['output']
+
+    def test_dispatch_hardware_op(self):
+        """Test that hardware operations call through to the printer."""
+        self.server.printer = Mock()
+        self.server.printer.open_cash_drawer.return_value = True
+
+        result = asyncio.run(self.server._dispatch_batch_op(
+            'open_cash_drawer', [], {'drawer_number': 2}))
+
+        assert result == {'success': True, 'type': 'open_cash_drawer'}
+        self.server.printer.open_cash_drawer.assert_called_once_with(
+            drawer_number=2)
+
+    def test_dispatch_unknown_function(self):
+        """Test that unknown batch functions are rejected."""
+        with pytest.raises(ValueError):
+            asyncio.run(self.server._dispatch_batch_op('shutil_rmtree', [], {}))